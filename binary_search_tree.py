@@ -7,21 +7,98 @@ The code draws inspiration from several descriptions of Binary Search Trees:
 
 We follow the Cormen et al. convention of allowing duplicate keys.
 """
+from array import array
 from typing import Optional
 
 
 class Node:
 
+    # A fixed slot layout keeps each node small and makes attribute access a
+    # fixed-offset load, which matters on the pointer-chasing descent loops.
+    __slots__ = ("key", "parent", "left", "right")
+
     def __init__(self, key, parent=None, left=None, right=None):
         self.key = key
         self.left, self.right = left, right
         self.parent = parent
 
 
+class NodePool:
+    """A free-list of Node instances that can be re-used across insertions.
+
+    Creating a fresh Node per insert makes the allocator the dominant cost of
+    mixed insert/delete workloads, so deleted nodes are parked here and handed
+    back out by later insertions. The free list is capped so that a large
+    burst of deletions cannot pin memory indefinitely.
+    """
+
+    def __init__(self, max_size: int = 1 << 14):
+        self.max_size = max_size
+        self._free = []
+
+    def acquire(self, key) -> Node:
+        """Return a node carrying the given key, re-using a pooled node when
+        one is available.
+
+        Args:
+            key: the key the node should carry.
+
+        Returns:
+            A node with cleared links.
+        """
+        if self._free:
+            node = self._free.pop()
+            node.key = key
+            return node
+        return Node(key)
+
+    def release(self, node: Node):
+        """Return a node to the pool once it has been unlinked from the tree.
+
+        Args:
+            node: the node to recycle.
+        """
+        if len(self._free) < self.max_size:
+            node.key = node.parent = node.left = node.right = None
+            self._free.append(node)
+
+
 class BinarySearchTree:
-    
-    def __init__(self, root: Optional[Node] = None):
+
+    def __init__(self, root: Optional[Node] = None, pool: Optional[NodePool] = None):
         self.root = root
+        self.pool = pool
+
+    @classmethod
+    def from_sorted(cls, keys, pool: Optional[NodePool] = None):
+        """Build a balanced tree from sorted keys in O(n).
+
+        Inserting n keys one by one costs O(n log n) in the best case and
+        degenerates to an O(n^2) right-chain on sorted input. When the keys
+        are known up front we can instead recurse on the midpoint of each
+        range, which builds a tree of minimal height in a single O(n) pass.
+        (For unsorted input, sort once with list.sort and call this.)
+
+        Args:
+            keys: the keys to insert, in sorted order.
+            pool: an optional NodePool to draw nodes from.
+
+        Returns:
+            A balanced BinarySearchTree containing the given keys.
+        """
+        def build(lo, hi, parent):
+            if lo >= hi:
+                return None
+            mid = (lo + hi) // 2
+            u = pool.acquire(keys[mid]) if pool else Node(keys[mid])
+            u.parent = parent
+            u.left = build(lo, mid, u)
+            u.right = build(mid + 1, hi, u)
+            return u
+
+        bst = cls(pool=pool)
+        bst.root = build(0, len(keys), None)
+        return bst
 
     def maximum(self, u: Node):
         """Return the node with the largest key in the subtree rooted at the given node
@@ -55,11 +132,14 @@ class BinarySearchTree:
         Args:
             v: the node to insert
         """
+        # hoist the key into a local so the descent loop performs a single
+        # attribute load per level rather than three
+        key = v.key
         u = self.root
         par = None
         while u:
             par = u
-            u = u.left if v.key < u.key else u.right
+            u = u.left if key < u.key else u.right
         v.parent = par
         if not par:  # handle case when the BST is empty
             self.root = v
@@ -68,6 +148,20 @@ class BinarySearchTree:
         else:
             par.right = v
 
+    def insert_key(self, key) -> Node:
+        """Insert a node carrying the given key, drawing the node from the
+        pool when one is attached.
+
+        Args:
+            key: the key to insert.
+
+        Returns:
+            The inserted node.
+        """
+        v = self.pool.acquire(key) if self.pool else Node(key)
+        self.insert(v)
+        return v
+
     def inorder(self, u: Node, visited: Optional[list] = None):
         """Complete an inorder traversal of the subtree rooted at u, appending
         each visited key to a list.
@@ -158,19 +252,199 @@ class BinarySearchTree:
             src.parent = old.parent
     
     def delete(self, u: Node):
+        """Delete the given node from the tree.
+
+        The shift_nodes and minimum helpers are inlined here (both remain
+        above for reference): delete sits on the hot path of churn-heavy
+        workloads, and each helper call pays for a Python frame plus
+        re-deriving state (such as the parent) that this method already
+        holds in locals.
+
+        Args:
+            u: the node to delete.
+        """
+        par = u.parent
         if not u.left:
-            self.shift_nodes(u, u.right)
+            src = u.right
         elif not u.right:
-            self.shift_nodes(u, u.left)
+            src = u.left
         else:
-            succ = self.minimum(u.right)
-            if succ != u.right:
-                self.shift_nodes(succ, succ.right)
+            # the successor is the minimum of the right subtree
+            succ = u.right
+            while succ.left:
+                succ = succ.left
+            if succ is not u.right:
+                # detach succ (a left child by construction), splicing in
+                # its right child
+                succ.parent.left = succ.right
+                if succ.right:
+                    succ.right.parent = succ.parent
                 succ.right = u.right
                 succ.right.parent = succ
-            self.shift_nodes(u, succ)
             succ.left = u.left
             succ.left.parent = succ
+            src = succ
+        # shift src into u's place
+        if not par:
+            self.root = src
+        elif u is par.left:
+            par.left = src
+        else:
+            par.right = src
+        if src:
+            src.parent = par
+        if self.pool:
+            self.pool.release(u)
+
+    def insert_many(self, keys):
+        """Insert a batch of keys into the tree.
+
+        Bulk ingestion is the common pattern (see main), so the descent loop
+        is inlined here with the root and pool held in locals: each key pays
+        one loop iteration per level rather than a method call plus repeated
+        attribute loads. For a sorted batch into an empty tree, prefer
+        from_sorted, which also balances the result.
+
+        Args:
+            keys: an iterable of keys to insert.
+        """
+        pool = self.pool
+        root = self.root
+        for key in keys:
+            v = pool.acquire(key) if pool else Node(key)
+            u = root
+            par = None
+            while u:
+                par = u
+                u = u.left if key < u.key else u.right
+            v.parent = par
+            if not par:
+                root = v
+            elif key < par.key:
+                par.left = v
+            else:
+                par.right = v
+        self.root = root
+
+    def flatten(self):
+        """Flatten the tree into a struct-of-arrays representation.
+
+        Nodes are numbered 0..n-1 in breadth-first order and stored in three
+        parallel arrays: the key of slot i lives in keys[i], while its children
+        live at slots left[i] and right[i] (-1 marks a missing child). Keeping
+        the keys contiguous in memory avoids the pointer chasing (and cache
+        misses) incurred by walking Node objects.
+
+        Returns:
+            A (keys, left, right) tuple of parallel arrays.
+
+        NOTE: this representation assumes integer keys (they are packed into
+        C-level arrays) and is a read-only snapshot - mutations should go
+        through the node-based API.
+        """
+        keys, left, right = array("q"), array("i"), array("i")
+        if not self.root:
+            return keys, left, right
+        queue = [self.root]
+        head = 0
+        while head < len(queue):
+            u = queue[head]
+            head += 1
+            keys.append(u.key)
+            if u.left:
+                left.append(len(queue))
+                queue.append(u.left)
+            else:
+                left.append(-1)
+            if u.right:
+                right.append(len(queue))
+                queue.append(u.right)
+            else:
+                right.append(-1)
+        return keys, left, right
+
+
+def inorder_flat(keys, left, right, root=0):
+    """Complete an inorder traversal over a flattened tree (see
+    BinarySearchTree.flatten), appending each visited key to a list.
+
+    The walk uses an explicit stack of integer slots rather than recursion,
+    so no Python frame is created per visited node.
+
+    Args:
+        keys: the array of node keys, indexed by slot.
+        left: the array of left-child slots (-1 when absent).
+        right: the array of right-child slots (-1 when absent).
+        root: the slot of the subtree root at which to start.
+
+    Returns:
+        The list of visited keys.
+    """
+    visited = []
+    stack = []
+    i = root if keys else -1
+    while i != -1 or stack:
+        while i != -1:
+            stack.append(i)
+            i = left[i]
+        i = stack.pop()
+        visited.append(keys[i])
+        i = right[i]
+    return visited
+
+
+def preorder_flat(keys, left, right, root=0):
+    """Complete a preorder traversal over a flattened tree (see
+    BinarySearchTree.flatten), appending each visited key to a list.
+
+    Args:
+        keys: the array of node keys, indexed by slot.
+        left: the array of left-child slots (-1 when absent).
+        right: the array of right-child slots (-1 when absent).
+        root: the slot of the subtree root at which to start.
+
+    Returns:
+        The list of visited keys.
+    """
+    visited = []
+    stack = [root] if keys else []
+    while stack:
+        i = stack.pop()
+        visited.append(keys[i])
+        if right[i] != -1:
+            stack.append(right[i])
+        if left[i] != -1:
+            stack.append(left[i])
+    return visited
+
+
+def postorder_flat(keys, left, right, root=0):
+    """Complete a postorder traversal over a flattened tree (see
+    BinarySearchTree.flatten), appending each visited key to a list.
+
+    We visit nodes in reversed (node, right, left) order and flip the result,
+    which needs only a single stack.
+
+    Args:
+        keys: the array of node keys, indexed by slot.
+        left: the array of left-child slots (-1 when absent).
+        right: the array of right-child slots (-1 when absent).
+        root: the slot of the subtree root at which to start.
+
+    Returns:
+        The list of visited keys.
+    """
+    visited = []
+    stack = [root] if keys else []
+    while stack:
+        i = stack.pop()
+        visited.append(keys[i])
+        if left[i] != -1:
+            stack.append(left[i])
+        if right[i] != -1:
+            stack.append(right[i])
+    visited.reverse()
+    return visited
 
 
 def main():
@@ -188,6 +462,11 @@ def main():
     print(f"Postorder traversal")
     print(bst.postorder(bst.root))
 
+    # the same traversals over the flattened (struct-of-arrays) tree
+    keys, left, right = bst.flatten()
+    print(f"Inorder traversal of the flattened tree")
+    print(inorder_flat(keys, left, right))
+
     node_to_delete = nodes[3]
     print(f"Deleting node with key {node_to_delete.key}")
     bst.delete(node_to_delete)
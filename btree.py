@@ -8,11 +8,17 @@ Note: the behaviour is not defined for duplicate keys.
 """
 
 import argparse
+from array import array
+from bisect import bisect_left
 from pathlib import Path
 
 
 class Node:
 
+    # A fixed slot layout keeps each node small and makes attribute access a
+    # fixed-offset load in the per-node search and split paths.
+    __slots__ = ("keys", "children", "is_leaf")
+
     def __init__(self, keys=None, children=None, is_leaf=True):
         self.keys = keys if keys else []
         self.children = children if children else []
@@ -36,14 +42,69 @@ class Node:
         return summary
 
 
+class NodePool:
+    """A free-list of Node instances that can be re-used across splits.
+
+    Splitting allocates a fresh Node and merging discards one, so a mixed
+    insert/delete workload churns through the allocator. Merged-away nodes
+    are parked here and handed back out by later splits. The free list is
+    capped so that a large burst of merges cannot pin memory indefinitely.
+    """
+
+    def __init__(self, max_size: int = 1 << 14):
+        self.max_size = max_size
+        self._free = []
+
+    def acquire(self, is_leaf: bool = True) -> Node:
+        """Return an empty node, re-using a pooled node when one is available.
+
+        Args:
+            is_leaf: whether the node is a leaf.
+
+        Returns:
+            A node with no keys or children.
+        """
+        if self._free:
+            node = self._free.pop()
+            node.is_leaf = is_leaf
+            return node
+        return Node(is_leaf=is_leaf)
+
+    def release(self, node: Node):
+        """Return a node to the pool once it has been unlinked from the tree.
+
+        Args:
+            node: the node to recycle.
+        """
+        if len(self._free) < self.max_size:
+            node.keys.clear()
+            node.children.clear()
+            node.is_leaf = True
+            self._free.append(node)
+
+
 class Btree:
 
-    def __init__(self, t, root=None, verbose=False):
+    def __init__(self, t, root=None, verbose=False, pool=None):
         """Create a B-tree with minimum degree t.
         """
         self.t = t
         self.root = root
         self.verbose = verbose
+        self.pool = pool
+
+    def _new_node(self, is_leaf: bool) -> Node:
+        """Allocate an empty node, drawing from the pool when one is attached.
+
+        Args:
+            is_leaf: whether the node is a leaf.
+
+        Returns:
+            A node with no keys or children.
+        """
+        if self.pool:
+            return self.pool.acquire(is_leaf)
+        return Node(is_leaf=is_leaf)
 
     def search(self, u, key):
         """Find the node containing key in the subtree rooted at u
@@ -56,11 +117,10 @@ class Btree:
             The node containing key, together with the position of the key
             or None if key is not in the tree.
         """
-        # linear scan to find index of key
-        i = 0
-        while i < len(u.keys) and key > u.keys[i]:
-            i += 1
-        if i < len(u.keys) and key == u.key[i]:
+        # binary search (in C) to find the index of key; O(log t) comparisons
+        # rather than the O(t) of a linear scan
+        i = bisect_left(u.keys, key)
+        if i < len(u.keys) and key == u.keys[i]:
             return (u, i)
         if u.is_leaf:
             return None
@@ -93,8 +153,7 @@ class Btree:
         Returns:
             The new root of the B-tree.
         """
-        new_root = Node()
-        new_root.is_leaf = False
+        new_root = self._new_node(is_leaf=False)
         new_root.children = [self.root]
         self.root = new_root
         self.split_child(new_root, 0)
@@ -108,9 +167,7 @@ class Btree:
             u: the root of the subtree to insert into.
             key: the key to insert.
         """
-        i = 0
-        while i < len(u.keys) and key > u.keys[i]:
-            i += 1
+        i = bisect_left(u.keys, key)
         if u.is_leaf:
             u.keys.insert(i, key)
             self.write_block(u)
@@ -130,87 +187,114 @@ class Btree:
         """
         t = self.t
         full_node = u.children[i]
-        new_node = Node()
-        new_node.is_leaf = full_node.is_leaf
+        new_node = self._new_node(is_leaf=full_node.is_leaf)
         new_node.keys = full_node.keys[t:]
         if not full_node.is_leaf:
             new_node.children = full_node.children[t:]
+            del full_node.children[t:]
         u.children.insert(i + 1, new_node)
         u.keys.insert(i, full_node.keys[t - 1])  # median
-        full_node.keys = full_node.keys[:t - 1]
-        full_node.children = full_node.children[:t]
+        # truncate the donor in place (a single memmove) rather than
+        # rebinding it to a fresh list copy
+        del full_node.keys[t - 1:]
         self.write_block(full_node)
         self.write_block(new_node)
         self.write_block(u)
 
     def delete(self, u: Node, key):
-        assert len(u.keys) >= self.t  or u == self.root, (
-            "The node u must have at least t keys or be the root"
-        )
-        i = 0
-        while i < len(u.keys) and key > u.keys[i]:
-            i += 1
-
-        # handle cases
-        if u.is_leaf:  # case 1
-            if i < len(u.keys) and key == u.keys[i]:
-                u.keys.pop(i)
-                self.write_block(u)
-            else:
+        """Delete key from the subtree rooted at u.
+
+        The deletion is a single top-down pass (Cormen et al. section 18.3):
+        before descending into a child we guarantee it holds at least t keys
+        by borrowing from a sibling or merging, so no second pass back up the
+        tree (and no Python recursion) is ever needed.
+
+        Args:
+            u: the root of the subtree to delete from.
+            key: the key to delete.
+        """
+        t = self.t
+        while True:
+            assert len(u.keys) >= t or u == self.root, (
+                "The node u must have at least t keys or be the root"
+            )
+            i = bisect_left(u.keys, key)
+
+            if u.is_leaf:  # case 1
+                if i < len(u.keys) and key == u.keys[i]:
+                    u.keys.pop(i)
+                    self.write_block(u)
+                    return
                 raise KeyError(f"Key {key} not found in the tree")
-            return
-        # u is not a leaf
-        self.read_block(u.children[i])
-        self.read_block(u.children[i+1])
-        self.write_block(u)
-        if i < len(u.keys) and key == u.keys[i]:  # case 2
-            if len(u.children[i].keys) >= self.t:  # case 2a
-                # pred_key = self.predecessor(key, u.children[i])
-                pred_key = self.maximum(u.children[i])
-                self.delete(u.children[i], pred_key)
-                u.keys[i] = pred_key
-            elif len(u.children[i+1].keys) >= self.t: # case 2b
-                # succ_key = self.successor(key, u.children[i+1])
-                # succ_key = self.minimum(key, u.children[i+1])
-                succ_key = self.minimum(u.children[i+1])
-                self.delete(u.children[i+1], succ_key)
-                u.keys[i] = succ_key
-            else:  # case 2c, both children have t-1 keys
-                self.merge_children(u, i)
-                if u == self.root and not u.keys:
-                    # height of the tree
-                    self.root = u.children[0]
-                self.delete(u.children[i], key)
-            self.write_block(u)
-        else: # case 3 (key not in u)
-            if len(u.children[i].keys) >= self.t:
-                self.delete(u.children[i], key)  # recurse
-            elif self.has_sibling_with_at_least_t_keys(u, i): # case 3a
-                j = self.index_of_sibling_with_at_least_t_keys(u, i)
-                self.read_block(u.chlidren[j])
-                if j == i + 1:  # right sibling has at least t keys
-                    u.children[i].keys.append(u.keys[i])
-                    u.keys[i] = u.children[j].keys.pop(0)
-                    if not u.children[j].is_leaf:
-                        u.children[i].children.append(u.children[j].children.pop(0))
-                else:  # left sibling has at least t keys
-                    u.children[i].keys.insert(0, u.keys[j])
-                    u.keys[j] = u.children[j].keys.pop()
-                    if not u.children[j].is_leaf:
-                        u.children[i].children.insert(0, u.children[j].children.pop())
-                self.write_block(u.chlidren[i])
-                self.write_block(u.chlidren[j])
-                self.delete(u.children[i], key)
-            else: # u is not a leaf and both siblings have t-1 keys
-                if i > 0:  # we merge with left sibling
-                    self.merge_children(u, i - 1)
-                    i -= 1 # we now have one less child, so we shift over
-                else:  # we merge with right sibling
+
+            # u is not a leaf
+            if i < len(u.keys) and key == u.keys[i]:  # case 2
+                self.read_block(u.children[i])
+                self.read_block(u.children[i+1])
+                if len(u.children[i].keys) >= t:  # case 2a
+                    # overwrite with the predecessor, then descend to remove
+                    # the predecessor from the left subtree
+                    pred_key = self.maximum(u.children[i])
+                    u.keys[i] = pred_key
+                    self.write_block(u)
+                    key = pred_key
+                    u = u.children[i]
+                elif len(u.children[i+1].keys) >= t:  # case 2b
+                    succ_key = self.minimum(u.children[i+1])
+                    u.keys[i] = succ_key
+                    self.write_block(u)
+                    key = succ_key
+                    u = u.children[i+1]
+                else:  # case 2c, both children have t-1 keys
                     self.merge_children(u, i)
-                if u == self.root and not u.keys:
-                    # reduce height of the tree
-                    self.root = u.children[0]
-                self.delete(u.children[i], key)
+                    if u == self.root and not u.keys:
+                        # reduce the height of the tree
+                        self.root = u.children[0]
+                    u = u.children[i]
+                continue
+
+            # case 3 (key not in u): ensure the child we descend into has at
+            # least t keys before we move down
+            child = u.children[i]
+            self.read_block(child)
+            # NOTE: the sibling rotations below shift list heads with
+            # insert(0, ...)/pop(0), which costs O(t) per rebalance. A deque
+            # would make those O(1) but has O(t) random access, which would
+            # slow down the bisect-based key lookups that every operation
+            # performs; for list-backed nodes the memmove is the cheaper
+            # trade unless t is very large.
+            if len(child.keys) < t:
+                left_sib = u.children[i-1] if i > 0 else None
+                right_sib = u.children[i+1] if i < len(u.children) - 1 else None
+                if left_sib and len(left_sib.keys) >= t:  # case 3a (left)
+                    self.read_block(left_sib)
+                    child.keys.insert(0, u.keys[i-1])
+                    u.keys[i-1] = left_sib.keys.pop()
+                    if not left_sib.is_leaf:
+                        child.children.insert(0, left_sib.children.pop())
+                    self.write_block(child)
+                    self.write_block(left_sib)
+                    self.write_block(u)
+                elif right_sib and len(right_sib.keys) >= t:  # case 3a (right)
+                    self.read_block(right_sib)
+                    child.keys.append(u.keys[i])
+                    u.keys[i] = right_sib.keys.pop(0)
+                    if not right_sib.is_leaf:
+                        child.children.append(right_sib.children.pop(0))
+                    self.write_block(child)
+                    self.write_block(right_sib)
+                    self.write_block(u)
+                else:  # case 3b, both siblings have t-1 keys
+                    if left_sib is not None:  # we merge with the left sibling
+                        self.merge_children(u, i - 1)
+                        child = u.children[i-1]
+                    else:  # we merge with the right sibling
+                        self.merge_children(u, i)
+                        child = u.children[i]
+                    if u == self.root and not u.keys:
+                        # reduce the height of the tree
+                        self.root = u.children[0]
+            u = child
 
     def has_sibling_with_at_least_t_keys(self, u: Node, i: int):
         """Check if child i of u has a sibling with at least t keys.
@@ -250,55 +334,92 @@ class Btree:
             u: the parent node.
             i: the index of the first child to merge.
         """
-        self.read_block(u.chlidren[i])
-        self.read_block(u.chlidren[i+1])
+        self.read_block(u.children[i])
+        self.read_block(u.children[i+1])
         median_key = u.keys.pop(i)
         u.children[i].keys.append(median_key)
         u.children[i].keys.extend(u.children[i+1].keys)
         if not u.children[i].is_leaf:
             u.children[i].children.extend(u.children[i+1].children)
-        u.children.pop(i+1)
-        self.write_block(u.chlidren[i])
+        merged_away = u.children.pop(i+1)
+        if self.pool:
+            self.pool.release(merged_away)
+        self.write_block(u.children[i])
         self.write_block(u)
 
     def inorder(self, node: Node):
         """Perform an inorder traversal of the B-tree.
 
+        The traversal is iterative: the stack holds (node, i) pairs meaning
+        "child i of node is the next one to descend into", so no Python frame
+        is created per visited node and deep trees cannot hit the recursion
+        limit.
+
         Args:
             node: Node - the root of the tree to traverse.
-        """
-        for i in range(len(node.keys)):
-            if not node.is_leaf:
-                self.inorder(node.children[i])
-            print(node.keys[i], end=" ")
 
-        # don't forget the last child (there are more children than keys)
-        if not node.is_leaf:
-            self.inorder(node.children[-1])
+        Returns:
+            The list of visited keys.
+        """
+        visited = []
+        stack = [(node, 0)]
+        while stack:
+            u, i = stack.pop()
+            if u.is_leaf:
+                visited.extend(u.keys)
+                continue
+            if 0 < i <= len(u.keys):
+                # the key separating child i-1 from child i
+                visited.append(u.keys[i - 1])
+            if i < len(u.children):
+                stack.append((u, i + 1))
+                stack.append((u.children[i], 0))
+        return visited
 
     def preorder(self, node: Node):
         """Perform a preorder traversal of the B-tree.
 
+        The traversal is iterative, with an explicit stack in place of
+        recursion.
+
         Args:
             node: Node - the root of the tree to traverse.
+
+        Returns:
+            The list of visited keys.
         """
-        for key in node.keys:
-            print(key, end=" ")
-        if not node.is_leaf:
-            for child in node.children:
-                self.preorder(child)
+        visited = []
+        stack = [node]
+        while stack:
+            u = stack.pop()
+            visited.extend(u.keys)
+            if not u.is_leaf:
+                stack.extend(reversed(u.children))
+        return visited
 
     def postorder(self, node: Node):
         """Perform a postorder traversal of the B-tree.
 
+        The traversal is iterative: we collect nodes in reversed postorder
+        with one stack, then emit them back-to-front.
+
         Args:
             node: Node - the root of the tree to traverse.
+
+        Returns:
+            The list of visited keys.
         """
-        if not node.is_leaf:
-            for child in node.children:
-                self.postorder(child)
-        for key in node.keys:
-            print(key, end=" ")
+        visited = []
+        order = []
+        stack = [node]
+        while stack:
+            u = stack.pop()
+            order.append(u)
+            if not u.is_leaf:
+                stack.extend(u.children)
+        for u in reversed(order):
+            visited.extend(u.keys)
+        return visited
 
     def minimum(self, node: Node) -> Node:
         """Find the minimum key in the subtree rooted at node.
@@ -326,6 +447,42 @@ class Btree:
             node = node.children[-1]
         return node.keys[-1]
 
+    def flatten(self):
+        """Flatten the tree into a struct-of-arrays representation.
+
+        Nodes are numbered 0..m-1 in breadth-first order. All keys are packed
+        into one contiguous array('q') and all child links into one
+        array('i') of node numbers, with per-node offsets: node i owns
+        keys[key_start[i]:key_start[i+1]] and its children are
+        children[child_start[i]:child_start[i+1]] (empty for leaves). This
+        replaces per-node Python lists of boxed ints with packed C arrays,
+        cutting memory per key roughly fourfold and keeping searches on
+        contiguous memory (see search_flat).
+
+        Returns:
+            A (keys, key_start, children, child_start) tuple of arrays.
+
+        NOTE: this representation assumes integer keys and is a read-only
+        snapshot - mutations should go through the node-based API.
+        """
+        keys = array("q")
+        key_start = array("i", [0])
+        children = array("i")
+        child_start = array("i", [0])
+        queue = [self.root]
+        head = 0
+        while head < len(queue):
+            u = queue[head]
+            head += 1
+            keys.extend(u.keys)
+            key_start.append(len(keys))
+            if not u.is_leaf:
+                for child in u.children:
+                    children.append(len(queue))
+                    queue.append(child)
+            child_start.append(len(children))
+        return keys, key_start, children, child_start
+
     def viz_btree(self, dest_path: Path, refresh: bool = False):
         # We only perform the import here to prevent people from having to install
         # graphviz if they don't want to visualise the tree.
@@ -353,6 +510,36 @@ class Btree:
         pgv_graph.draw(dest_path, prog="dot")
 
 
+def search_flat(keys, key_start, children, child_start, key):
+    """Find a key in a flattened B-tree (see Btree.flatten).
+
+    The descent runs bisect directly on the packed key array using per-node
+    offsets, so it touches only contiguous memory and never dereferences a
+    Node object.
+
+    Args:
+        keys: the packed key array.
+        key_start: per-node offsets into keys.
+        children: the packed array of child node numbers.
+        child_start: per-node offsets into children.
+        key: the key to search for.
+
+    Returns:
+        The (node number, position within node) of the key, or None if key
+        is not in the tree.
+    """
+    node = 0
+    while True:
+        lo, hi = key_start[node], key_start[node + 1]
+        i = bisect_left(keys, key, lo, hi)
+        if i < hi and keys[i] == key:
+            return (node, i - lo)
+        first_child = child_start[node]
+        if child_start[node + 1] == first_child:  # leaf
+            return None
+        node = children[first_child + (i - lo)]
+
+
 def main():
     # pylint: disable=line-too-long
     # flake8: noqa: E501
@@ -367,16 +554,14 @@ def main():
     for key in insert_keys:
         btree.insert(key)
 
-    # print out traversals
+    # print out traversals (each traversal returns its keys, which are
+    # emitted in a single print call rather than one write per key)
     print(f"Inorder traversal")
-    btree.inorder(btree.root)
-    print("")
+    print(*btree.inorder(btree.root))
     print(f"Preorder traversal")
-    btree.preorder(btree.root)
-    print("")
+    print(*btree.preorder(btree.root))
     print(f"Postorder traversal")
-    btree.postorder(btree.root)
-    print("")
+    print(*btree.postorder(btree.root))
 
     if args.viz:
         dest_path = Path("figs/btree.png")
@@ -11,6 +11,49 @@ This code is based on the description of the algorithm in the following sources:
 - https://en.wikipedia.org/wiki/Counting_sort
 - Chapter 8 of T. H. Cormen, et al., "Introduction to algorithms", MIT press (2022)
 """
+from array import array
+
+
+# Cache for the optional Numba-compiled kernel (False marks "unavailable" so
+# we only attempt the import once).
+_jit_kernel = None
+
+
+def _get_jit_kernel():
+    """Build (and cache) a Numba-compiled counting sort kernel.
+
+    The three integer loops of counting sort compile to straight-line native
+    code under Numba, removing the bytecode dispatch per element. We only
+    perform the imports here to keep Numba (and NumPy) optional.
+
+    Returns:
+        The compiled kernel, or None when Numba/NumPy are not installed.
+    """
+    global _jit_kernel
+    if _jit_kernel is None:
+        try:
+            import numpy as np
+            from numba import njit
+        except ImportError:
+            _jit_kernel = False
+        else:
+            @njit(cache=True)
+            def kernel(a, k):
+                n = a.shape[0]
+                counts = np.zeros(k, np.int64)
+                for i in range(n):
+                    counts[a[i]] += 1
+                for i in range(1, k):
+                    counts[i] += counts[i - 1]
+                output = np.empty(n, a.dtype)
+                for i in range(n - 1, -1, -1):
+                    position = counts[a[i]] - 1
+                    output[position] = a[i]
+                    counts[a[i]] = position
+                return output
+
+            _jit_kernel = kernel
+    return _jit_kernel or None
 
 
 def counting_sort(A, k):
@@ -26,8 +69,29 @@ def counting_sort(A, k):
     NOTE: Counting sort assumes that all inputs are integers between 0 and k-1 inclusive.
     """
     n = len(A)
-    counts = [0 for _ in range(k)]
-    output = [None for _ in range(n)]
+
+    # For larger inputs we dispatch to NumPy when it is available, which runs
+    # the counting and placement passes in C rather than paying interpreter
+    # overhead per element. Since the keys are the values (there is no
+    # satellite data), repeating each key by its count reproduces the stable
+    # output of the scatter loop below. We only perform the import here so
+    # that NumPy remains an optional dependency.
+    if n >= 64:
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+        if np is not None:
+            kernel = _get_jit_kernel()
+            if kernel is not None:
+                return kernel(np.asarray(A, dtype=np.int64), k).tolist()
+            counts = np.bincount(np.asarray(A, dtype=np.int64), minlength=k)
+            return np.repeat(np.arange(len(counts)), counts).tolist()
+
+    # backing the counters and output with array('q') stores unboxed 8-byte
+    # ints in contiguous buffers, rather than lists of PyObject pointers
+    counts = array("q", [0]) * k
+    output = array("q", [0]) * n
     for key in A:
         counts[key] += 1
     for i in range(1, k):
@@ -35,7 +99,7 @@ def counting_sort(A, k):
     for key in reversed(A):
         output[counts[key] - 1] = key
         counts[key] = counts[key] - 1
-    return output
+    return output.tolist()
 
 
 def main():
@@ -0,0 +1,651 @@
+"""A Red-Black Tree stored as flat parallel arrays (a struct-of-arrays layout).
+
+The object-graph implementation in red_black_tree.py allocates one PyObject per
+node, so every step of a walk chases a pointer to a separately-allocated
+object. Here a node is just an integer index into five parallel columns -
+keys (array('q')), parent/left/right links (array('l')) and colors
+(a bytearray) - so the whole tree lives in a handful of contiguous buffers:
+roughly 25 packed bytes per node instead of a boxed object, with no
+per-node allocation. The sentinel nil is index 0, which makes "is this nil"
+a plain integer truthiness test.
+
+The algorithms are the standard ones from Chapter 13 of T. H. Cormen, et al.,
+"Introduction to algorithms", MIT press, (2022), transcribed from the node
+version in red_black_tree.py.
+"""
+from array import array
+
+BLACK = 0
+RED = 1
+
+
+class FlatRedBlackTree:
+
+    # The color column stays separate rather than being folded into the low
+    # bit of the parent index (the Linux-rbtree tagged-pointer trick): that
+    # trick pays off when it shrinks a C node struct by a word, but these
+    # columns are independent buffers - merging would save one byte of the
+    # ~25 per node while putting a shift/mask on every parent read in the
+    # fix-up loops
+    INITIAL_CAPACITY = 16
+
+    def __init__(self):
+        # the columns are allocated with spare capacity up front and grown
+        # geometrically (see _alloc): growing five buffers on every insert
+        # would fragment them across the allocator, and per-append growth
+        # reallocates each column O(log n) times instead of once per
+        # doubling. _size tracks how many slots are in use; len(self.keys)
+        # is the capacity.
+        # Index 0 is the nil sentinel: black, self-parented, childless.
+        # Its parent field is written (and ignored) by delete, exactly as
+        # the sentinel node's is in the pointer version
+        capacity = self.INITIAL_CAPACITY
+        self.keys = array("q", bytes(8 * capacity))
+        self.parent = array("l", [0]) * capacity
+        self.left = array("l", [0]) * capacity
+        self.right = array("l", [0]) * capacity
+        self.color = bytearray(capacity)
+        self._size = 1
+        self.root = 0
+
+    def __repr__(self):
+        n = self._size - 1
+        return f"FlatRedBlackTree with {n} allocated nodes, root key " \
+               f"{self.keys[self.root] if self.root else None}"
+
+    def _alloc(self, key) -> int:
+        """Claim the next free slot in the columns and return its index.
+
+        Doubles the capacity when the columns are full, so a sequence of n
+        inserts reallocates each column O(log n) times.
+
+        Args:
+            key: the key of the new node.
+        """
+        i = self._size
+        if i == len(self.keys):
+            self.reserve(2 * i)
+        self._size = i + 1
+        self.keys[i] = key
+        self.parent[i] = 0
+        self.left[i] = 0
+        self.right[i] = 0
+        self.color[i] = RED
+        return i
+
+    def reserve(self, capacity: int):
+        """Grow the columns to hold at least capacity slots.
+
+        Callers that know how many inserts are coming can reserve the space
+        once and skip the intermediate doublings (the nil sentinel occupies
+        one slot, so pass the expected node count plus one).
+
+        Args:
+            capacity: the total number of slots to provide for.
+        """
+        extra = capacity - len(self.keys)
+        if extra <= 0:
+            return
+        self.keys.extend(array("q", bytes(8 * extra)))
+        self.parent.extend(array("l", [0]) * extra)
+        self.left.extend(array("l", [0]) * extra)
+        self.right.extend(array("l", [0]) * extra)
+        self.color.extend(bytes(extra))
+
+    def search(self, key) -> int:
+        """Search for a node with a given key.
+
+        Args:
+            key: the key to search for.
+
+        Returns:
+            The index of the node with the given key, or 0 (nil) if absent.
+        """
+        keys = self.keys
+        left = self.left
+        right = self.right
+        i = self.root
+        while i and keys[i] != key:
+            i = left[i] if key < keys[i] else right[i]
+        return i
+
+    def minimum(self, i: int) -> int:
+        """Find the minimum node in the subtree rooted at index i.
+
+        Args:
+            i: the root of the subtree to search.
+
+        Returns:
+            The index of the minimum node in the subtree rooted at i.
+        """
+        left = self.left
+        while left[i]:
+            i = left[i]
+        return i
+
+    def maximum(self, i: int) -> int:
+        """Find the maximum node in the subtree rooted at index i.
+
+        Args:
+            i: the root of the subtree to search.
+
+        Returns:
+            The index of the maximum node in the subtree rooted at i.
+        """
+        right = self.right
+        while right[i]:
+            i = right[i]
+        return i
+
+    def inorder(self, i: int):
+        """Perform an inorder traversal of the subtree rooted at index i.
+
+        Args:
+            i: the root of the subtree to traverse.
+
+        Returns:
+            The list of visited keys.
+        """
+        keys = self.keys
+        left = self.left
+        right = self.right
+        visited = []
+        stack = []
+        while i or stack:
+            while i:
+                stack.append(i)
+                i = left[i]
+            i = stack.pop()
+            visited.append(keys[i])
+            i = right[i]
+        return visited
+
+    def rotate_left(self, u: int):
+        """Rotate the subtree rooted at index u to the left."""
+        left, right, parent = self.left, self.right, self.parent
+        v = right[u]
+        right[u] = left[v]
+        if left[v]:
+            parent[left[v]] = u
+        parent[v] = parent[u]
+        if not parent[u]:
+            self.root = v
+        elif u == left[parent[u]]:
+            left[parent[u]] = v
+        else:
+            right[parent[u]] = v
+        left[v], parent[u] = u, v
+
+    def rotate_right(self, v: int):
+        """Rotate the subtree rooted at index v to the right."""
+        left, right, parent = self.left, self.right, self.parent
+        u = left[v]
+        left[v] = right[u]
+        if right[u]:
+            parent[right[u]] = v
+        parent[u] = parent[v]
+        if not parent[v]:
+            self.root = u
+        elif v == right[parent[v]]:
+            right[parent[v]] = u
+        else:
+            left[parent[v]] = u
+        right[u], parent[v] = v, u
+
+    def insert(self, key) -> int:
+        """Insert a new node with the given key into the tree.
+
+        Args:
+            key: the key to insert.
+
+        Returns:
+            The index of the newly inserted node.
+        """
+        keys = self.keys
+        left = self.left
+        right = self.right
+
+        # typical Binary Search Tree insertion method
+        node = self.root
+        parent = 0
+        while node:
+            parent = node
+            node = left[node] if key < keys[node] else right[node]
+
+        i = self._alloc(key)  # allocated red with nil children
+        self.parent[i] = parent
+
+        if not parent:  # handle the case when the tree is empty
+            self.root = i
+        elif key < keys[parent]:
+            left[parent] = i
+        else:
+            right[parent] = i
+
+        self.fix_insert_violations(i)
+        return i
+
+    def fix_insert_violations(self, i: int):
+        """Fix any Red-Black Tree insert violations.
+
+        Args:
+            i: the index of the node that was inserted.
+        """
+        left, right, parent, color = self.left, self.right, self.parent, self.color
+        while i != self.root and color[parent[i]] == RED:
+            if parent[i] == left[parent[parent[i]]]:
+                uncle = right[parent[parent[i]]]
+                if color[uncle] == RED:
+                    color[parent[i]] = BLACK
+                    color[uncle] = BLACK
+                    color[parent[parent[i]]] = RED
+                    i = parent[parent[i]]
+                else:
+                    if i == right[parent[i]]:
+                        i = parent[i]
+                        self.rotate_left(i)
+                    color[parent[i]] = BLACK
+                    color[parent[parent[i]]] = RED
+                    self.rotate_right(parent[parent[i]])
+            else:
+                uncle = left[parent[parent[i]]]
+                if color[uncle] == RED:
+                    color[parent[i]] = BLACK
+                    color[uncle] = BLACK
+                    color[parent[parent[i]]] = RED
+                    i = parent[parent[i]]
+                else:
+                    if i == left[parent[i]]:
+                        i = parent[i]
+                        self.rotate_right(i)
+                    color[parent[i]] = BLACK
+                    color[parent[parent[i]]] = RED
+                    self.rotate_left(parent[parent[i]])
+        self.color[self.root] = BLACK
+
+    def shift_nodes(self, old: int, new: int):
+        """Replace the subtree rooted at index old with the one at index new.
+
+        Args:
+            old: the root of the subtree to replace.
+            new: the root of the subtree to replace with.
+        """
+        left, right, parent = self.left, self.right, self.parent
+        if not parent[old]:
+            self.root = new
+        elif old == left[parent[old]]:
+            left[parent[old]] = new
+        else:
+            right[parent[old]] = new
+        parent[new] = parent[old]
+
+    def delete(self, i: int):
+        """Delete the node at index i from the tree.
+
+        The node's slot in the columns is not reclaimed (the tree only ever
+        grows its backing arrays); it is simply unlinked.
+
+        Args:
+            i: the index of the node to delete.
+        """
+        left, right, parent, color = self.left, self.right, self.parent, self.color
+        original_color = color[i]
+        if not left[i]:
+            x = right[i]
+            self.shift_nodes(i, x)
+        elif not right[i]:
+            x = left[i]
+            self.shift_nodes(i, x)
+        else:
+            v = self.minimum(right[i])
+            original_color = color[v]
+            x = right[v]
+            if parent[v] == i:
+                parent[x] = v
+            else:
+                self.shift_nodes(v, right[v])
+                right[v] = right[i]
+                parent[right[v]] = v
+            self.shift_nodes(i, v)
+            left[v] = left[i]
+            parent[left[v]] = v
+            color[v] = color[i]
+        if original_color == BLACK:
+            self.fix_delete_violations(x)
+
+    def fix_delete_violations(self, i: int):
+        """Fix any Red-Black Tree delete violations.
+
+        Args:
+            i: the index at which the doubled black was left.
+        """
+        left, right, parent, color = self.left, self.right, self.parent, self.color
+        while i != self.root and color[i] == BLACK:
+            if i == left[parent[i]]:
+                s = right[parent[i]]
+                if color[s] == RED:
+                    color[s] = BLACK
+                    color[parent[i]] = RED
+                    self.rotate_left(parent[i])
+                    s = right[parent[i]]
+                if color[left[s]] == BLACK and color[right[s]] == BLACK:
+                    color[s] = RED
+                    i = parent[i]
+                else:
+                    if color[right[s]] == BLACK:
+                        color[left[s]] = BLACK
+                        color[s] = RED
+                        self.rotate_right(s)
+                        s = right[parent[i]]
+                    color[s] = color[parent[i]]
+                    color[parent[i]] = BLACK
+                    color[right[s]] = BLACK
+                    self.rotate_left(parent[i])
+                    i = self.root
+            else:
+                s = left[parent[i]]
+                if color[s] == RED:
+                    color[s] = BLACK
+                    color[parent[i]] = RED
+                    self.rotate_right(parent[i])
+                    s = left[parent[i]]
+                if color[right[s]] == BLACK and color[left[s]] == BLACK:
+                    color[s] = RED
+                    i = parent[i]
+                else:
+                    if color[left[s]] == BLACK:
+                        color[right[s]] = BLACK
+                        color[s] = RED
+                        self.rotate_left(s)
+                        s = left[parent[i]]
+                    color[s] = color[parent[i]]
+                    color[parent[i]] = BLACK
+                    color[left[s]] = BLACK
+                    self.rotate_right(parent[i])
+                    i = self.root
+        color[i] = BLACK
+
+    def contains_many(self, query_keys) -> list:
+        """Test many keys against the tree in one call.
+
+        Calling search in a Python loop pays method dispatch and attribute
+        lookups per key; here the columns are bound to locals once and the
+        descent runs inline for the whole batch. When NumPy and Numba are
+        available the batch instead runs through a compiled kernel over the
+        columns (walks are independent reads, so the loop parallelizes).
+
+        Args:
+            query_keys: the keys to test.
+
+        Returns:
+            A list of booleans, one per query key.
+        """
+        kernel = _get_contains_kernel()
+        if kernel:
+            import numpy as np
+            out = np.zeros(len(query_keys), dtype=np.bool_)
+            kernel(np.asarray(query_keys, dtype=np.int64),
+                   np.asarray(self.keys, dtype=np.int64),
+                   np.asarray(self.left, dtype=np.int64),
+                   np.asarray(self.right, dtype=np.int64),
+                   self.root, out)
+            return out.tolist()
+
+        keys = self.keys
+        left = self.left
+        right = self.right
+        root = self.root
+        result = []
+        append = result.append
+        for key in query_keys:
+            i = root
+            while i and keys[i] != key:
+                i = left[i] if key < keys[i] else right[i]
+            append(i != 0)
+        return result
+
+    def __contains__(self, key) -> bool:
+        """Check if the tree contains a node with the given key.
+
+        Args:
+            key: the key to search for.
+
+        Returns:
+            True if the tree contains a node with the given key, False otherwise.
+        """
+        return self.search(key) != 0
+
+    def __delitem__(self, key):
+        """Delete the node with the given key from the tree.
+
+        Args:
+            key: the key of the node to delete.
+        """
+        i = self.search(key)
+        if not i:
+            raise KeyError(str(key))
+        self.delete(i)
+
+
+# cache for the optional Numba-compiled kernels
+_jit_kernel = None
+_contains_kernel = None
+
+
+def _get_contains_kernel():
+    """Compile (once) and return the Numba batch-lookup kernel, or False.
+
+    As with _get_jit_kernel, NumPy and Numba are optional: when either is
+    missing we record False and contains_many uses its pure-Python loop.
+    """
+    global _contains_kernel
+    if _contains_kernel is None:
+        try:
+            import numpy as np
+            from numba import njit, prange
+        except ImportError:
+            _contains_kernel = False
+            return _contains_kernel
+
+        @njit(parallel=True, cache=True)
+        def kernel(query_keys, keys, lft, rgt, root, out):
+            for n in prange(query_keys.shape[0]):
+                k = query_keys[n]
+                i = root
+                while i and keys[i] != k:
+                    i = lft[i] if k < keys[i] else rgt[i]
+                out[n] = i != 0
+
+        kernel(np.empty(0, dtype=np.int64), np.zeros(1, dtype=np.int64),
+               np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64),
+               0, np.empty(0, dtype=np.bool_))
+        _contains_kernel = kernel
+    return _contains_kernel
+
+
+def _get_jit_kernel():
+    """Compile (once) and return the Numba bulk-insert kernel, or False.
+
+    The insert/fix-up path is a tight integer loop over the flat columns -
+    exactly the shape Numba compiles well. The kernel operates on NumPy
+    views of the same five-column layout used by FlatRedBlackTree, so no
+    algorithmic translation is involved, only removal of interpreter
+    dispatch. NumPy and Numba remain optional dependencies (as with
+    pygraphviz in btree.py): when either is missing we record False and
+    callers fall back to the pure-Python insert loop.
+    """
+    global _jit_kernel
+    if _jit_kernel is None:
+        try:
+            import numpy as np
+            from numba import njit
+        except ImportError:
+            _jit_kernel = False
+            return _jit_kernel
+
+        @njit(cache=True)
+        def rol(par, lft, rgt, root, u):
+            v = rgt[u]
+            rgt[u] = lft[v]
+            if lft[v]:
+                par[lft[v]] = u
+            par[v] = par[u]
+            if not par[u]:
+                root = v
+            elif u == lft[par[u]]:
+                lft[par[u]] = v
+            else:
+                rgt[par[u]] = v
+            lft[v] = u
+            par[u] = v
+            return root
+
+        @njit(cache=True)
+        def ror(par, lft, rgt, root, v):
+            u = lft[v]
+            lft[v] = rgt[u]
+            if rgt[u]:
+                par[rgt[u]] = v
+            par[u] = par[v]
+            if not par[v]:
+                root = u
+            elif v == rgt[par[v]]:
+                rgt[par[v]] = u
+            else:
+                lft[par[v]] = u
+            rgt[u] = v
+            par[v] = u
+            return root
+
+        @njit(cache=True)
+        def kernel(keys_in, keys, par, lft, rgt, col):
+            root = 0
+            for n in range(keys_in.shape[0]):
+                key = keys_in[n]
+                i = n + 1
+                keys[i] = key
+                col[i] = 1  # red
+
+                node = root
+                parent = 0
+                while node:
+                    parent = node
+                    node = lft[node] if key < keys[node] else rgt[node]
+                par[i] = parent
+                if not parent:
+                    root = i
+                elif key < keys[parent]:
+                    lft[parent] = i
+                else:
+                    rgt[parent] = i
+
+                while i != root and col[par[i]] == 1:
+                    if par[i] == lft[par[par[i]]]:
+                        uncle = rgt[par[par[i]]]
+                        if col[uncle] == 1:
+                            col[par[i]] = 0
+                            col[uncle] = 0
+                            col[par[par[i]]] = 1
+                            i = par[par[i]]
+                        else:
+                            if i == rgt[par[i]]:
+                                i = par[i]
+                                root = rol(par, lft, rgt, root, i)
+                            col[par[i]] = 0
+                            col[par[par[i]]] = 1
+                            root = ror(par, lft, rgt, root, par[par[i]])
+                    else:
+                        uncle = lft[par[par[i]]]
+                        if col[uncle] == 1:
+                            col[par[i]] = 0
+                            col[uncle] = 0
+                            col[par[par[i]]] = 1
+                            i = par[par[i]]
+                        else:
+                            if i == lft[par[i]]:
+                                i = par[i]
+                                root = ror(par, lft, rgt, root, i)
+                            col[par[i]] = 0
+                            col[par[par[i]]] = 1
+                            root = rol(par, lft, rgt, root, par[par[i]])
+                col[root] = 0
+            return root
+
+        # trigger compilation once, away from the first real workload
+        kernel(np.empty(0, dtype=np.int64), np.zeros(1, dtype=np.int64),
+               np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64),
+               np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.uint8))
+        _jit_kernel = kernel
+    return _jit_kernel
+
+
+def from_keys_nb(insert_keys) -> FlatRedBlackTree:
+    """Build a FlatRedBlackTree from the given keys with the Numba kernel.
+
+    Args:
+        insert_keys: the keys to insert, in insertion order.
+
+    Returns:
+        The resulting tree (built by the pure-Python path when NumPy or
+        Numba is unavailable).
+    """
+    tree = FlatRedBlackTree()
+    kernel = _get_jit_kernel()
+    if not kernel:
+        for key in insert_keys:
+            tree.insert(key)
+        return tree
+
+    import numpy as np
+
+    n = len(insert_keys)
+    keys_in = np.asarray(insert_keys, dtype=np.int64)
+    keys = np.zeros(n + 1, dtype=np.int64)
+    par = np.zeros(n + 1, dtype=np.int64)
+    lft = np.zeros(n + 1, dtype=np.int64)
+    rgt = np.zeros(n + 1, dtype=np.int64)
+    col = np.zeros(n + 1, dtype=np.uint8)
+    tree.root = int(kernel(keys_in, keys, par, lft, rgt, col))
+    tree.keys = array("q", keys.tolist())
+    tree.parent = array("l", par.tolist())
+    tree.left = array("l", lft.tolist())
+    tree.right = array("l", rgt.tolist())
+    tree.color = bytearray(col.tolist())
+    tree._size = n + 1
+    return tree
+
+
+def main():
+    rbt = FlatRedBlackTree()
+    insert_keys = [5, 3, 2, 7, 1, 8, 9, 12]
+    for key in insert_keys:
+        rbt.insert(key)
+
+    print(f"Inorder traversal")
+    print(*rbt.inorder(rbt.root))
+
+    delete_key = 7
+    print(f"Deleting key {delete_key}")
+    del rbt[delete_key]
+
+    print(f"Inorder traversal after deletion")
+    print(*rbt.inorder(rbt.root))
+
+    print(f"Minimum key: {rbt.keys[rbt.minimum(rbt.root)]}")
+    print(f"Maximum key: {rbt.keys[rbt.maximum(rbt.root)]}")
+
+    """
+    Print out:
+
+    Inorder traversal
+    1 2 3 5 7 8 9 12
+    Deleting key 7
+    Inorder traversal after deletion
+    1 2 3 5 8 9 12
+    Minimum key: 1
+    Maximum key: 12
+    """
+
+
+if __name__ == "__main__":
+    main()
@@ -18,11 +18,27 @@ class HashTable:
         """Initialize the hash table.
 
         Args:
-            init_size: the initial size of the hash table.
+            init_size: the initial size of the hash table (rounded up to the
+                next power of two, so the modulo in every probe step reduces
+                to a bitwise AND with size - 1).
             resize_threshold: the load factor at which the hash table should be resized.
         """
-        self.slots = [None for _ in range(init_size)]
-        self.values = [None for _ in range(init_size)]
+        size = 1 << (init_size - 1).bit_length()  # next power of two
+        self.slots = [None for _ in range(size)]
+        self.values = [None for _ in range(size)]
+        # the full hash of each occupied slot's key, computed once at
+        # insertion: resizes re-bucket from this column instead of calling
+        # __hash__ again on every key, which matters for keys (strings,
+        # tuples) whose hashing is not free
+        self.hashes = [None for _ in range(size)]
+        # one tag byte per slot: 0 marks an empty slot, occupied slots hold
+        # 7 hash bits with the top bit set. Probes reject mismatched slots on
+        # a C-level byte compare (and detect empties for free) before paying
+        # for a boxed key equality; SIMD tables probe 8-16 such tags per
+        # instruction, and this byte column is the same idea at the
+        # granularity CPython can express
+        self.tags = bytearray(size)
+        self._mask = size - 1
         self.slots_filled = 0
         self.resize_threshold = resize_threshold
 
@@ -34,24 +50,70 @@ class HashTable:
             value: the value to insert.
 
         """
-        slot = self._hash(key)
+        # hash once per operation: the slot index and the tag byte are both
+        # carved out of the same value, and the probe loop never rehashes
+        h = hash(key)
 
-        anticipated_load_factor = (self.slots_filled + 1) / len(self.slots)
-        if anticipated_load_factor > self.resize_threshold:
+        # trigger: (slots_filled + 1) / size > resize_threshold, rearranged
+        # to avoid a floating-point division per insert
+        if self.slots_filled + 1 > self.resize_threshold * len(self.slots):
             self._increase_size()
 
-        while (self.slots[slot] != key) and (self.slots[slot] is not None):
-            slot = (slot + 1) % len(self.slots)
-
-        self.slots[slot] = key
+        # keys and values live in parallel flat lists (a struct-of-arrays
+        # layout), so the probe loop below only touches the tag and key
+        # columns; bind them to locals to avoid an attribute load per probe
+        # step
+        slots = self.slots
+        tags = self.tags
+        mask = self._mask
+        slot = h & mask
+        tag = self._tag(h)
+        while tags[slot] and not (tags[slot] == tag and slots[slot] == key):
+            slot = (slot + 1) & mask
+
+        slots[slot] = key
+        tags[slot] = tag
+        self.hashes[slot] = h
         self.values[slot] = value
         self.slots_filled += 1
 
     def _increase_size(self):
-        curr_size = len(self.slots)
-        print(f"Resizing the table from {curr_size} to {curr_size * 2}")
-        self.slots = self.slots + [None for _ in range(curr_size)]
-        self.values = self.values + [None for _ in range(curr_size)]
+        """Double the table and rehash every occupied slot.
+
+        Because slots are assigned as key % size, simply appending empty
+        slots (as this method previously did) strands existing keys in
+        positions that no longer match their hash, so lookups for them fail
+        after a grow. Each doubling therefore re-inserts the occupied slots
+        into the new table; the cost is O(n) but amortizes to O(1) per
+        insert over the successive doublings.
+        """
+        old_slots = self.slots
+        old_values = self.values
+        old_hashes = self.hashes
+        new_size = len(old_slots) * 2
+        new_mask = new_size - 1
+        slots = [None for _ in range(new_size)]
+        values = [None for _ in range(new_size)]
+        hashes = [None for _ in range(new_size)]
+        tags = bytearray(new_size)
+        for key, value, h, tag in zip(old_slots, old_values, old_hashes,
+                                      self.tags):
+            if not tag:
+                continue
+            # re-bucket from the stored hash rather than calling __hash__
+            # again on every key
+            slot = h & new_mask
+            while tags[slot]:
+                slot = (slot + 1) & new_mask
+            slots[slot] = key
+            values[slot] = value
+            hashes[slot] = h
+            tags[slot] = tag
+        self.slots = slots
+        self.values = values
+        self.hashes = hashes
+        self.tags = tags
+        self._mask = new_mask
 
     def _hash(self, key):
         """Hash the key to a slot in the hash table.
@@ -59,7 +121,20 @@ class HashTable:
         Args:
             key: the key to hash.
         """
-        return key % len(self.slots)
+        # table sizes are powers of two, so reducing modulo the size is a
+        # single AND with the precomputed mask
+        return hash(key) & self._mask
+
+    def _tag(self, h):
+        """Compute the tag byte stored for a key with hash h.
+
+        Args:
+            h: the key's hash.
+        """
+        # 7 hash bits (taken above the slot-index bits so tags stay useful
+        # within a probe chain) with the top bit set, so 0 never collides
+        # with an occupied slot's tag
+        return ((h >> 7) & 0x7F) | 0x80
 
     def search(self, key):
         """Search for a value with a given key in the hash table.
@@ -78,6 +153,8 @@ class HashTable:
         """
         slot = self._probe(key)
         self.slots[slot] = None
+        self.tags[slot] = 0
+        self.hashes[slot] = None
         self.values[slot] = None
         self.slots_filled -= 1
 
@@ -87,12 +164,26 @@ class HashTable:
         Args:
             key: the key to probe for.
         """
-        slot = self._hash(key)
-        while self.slots[slot] != key:
-            if self.slots[slot] is None:
+        h = hash(key)
+        # probe only the tag and key columns, bound to locals (see insert).
+        # Long probe chains are latency-bound on cache misses; a compiled
+        # table would issue software prefetches a few slots ahead to hide
+        # them, but CPython offers no way to express a non-binding load -
+        # any "dummy read" here is a full boxed list indexing, costing more
+        # than the miss it hides. Keeping the probe loop minimal is the
+        # best available option at this level.
+        slots = self.slots
+        tags = self.tags
+        mask = self._mask
+        slot = h & mask
+        tag = self._tag(h)
+        while True:
+            t = tags[slot]
+            if t == tag and slots[slot] == key:
+                return slot
+            if not t:
                 raise KeyError(f"Could not find {key} in hash table")
-            slot = (slot + 1) % len(self.slots)
-        return slot
+            slot = (slot + 1) & mask
 
     def __repr__(self):
         summary = (f"Hash table with {self.slots_filled} entries\n"
@@ -100,6 +191,161 @@ class HashTable:
         return summary
 
 
+class CuckooHashTable:
+    """A bucketized cuckoo hash table for integer keys.
+
+    Each key has two candidate buckets (given by independent hash functions)
+    of BUCKET_SIZE slots each, so a lookup inspects at most eight slots in
+    two contiguous regions - worst-case O(1), with none of the unbounded
+    probe chains of the linear-probing table above. Inserts that find both
+    buckets full evict a resident key to its alternate bucket ("kicking"),
+    and a long kick chain triggers a table doubling. Bucketized cuckoo
+    tables stay healthy past 90% occupancy, versus the ~67% ceiling the
+    linear-probing table resizes at.
+    """
+
+    BUCKET_SIZE = 4
+    MAX_KICKS = 32
+
+    def __init__(self, init_buckets=8):
+        """Initialize the cuckoo hash table.
+
+        Args:
+            init_buckets: the initial number of buckets (rounded up to the
+                next power of two).
+        """
+        num_buckets = 1 << (init_buckets - 1).bit_length()
+        self._init_storage(num_buckets)
+        self.slots_filled = 0
+
+    def _init_storage(self, num_buckets):
+        size = num_buckets * self.BUCKET_SIZE
+        self.slots = [None for _ in range(size)]
+        self.values = [None for _ in range(size)]
+        self._bucket_mask = num_buckets - 1
+        # shift that maps a 32-bit product onto log2(num_buckets) high bits
+        self._shift = 32 - (num_buckets.bit_length() - 1)
+
+    def _hash1(self, key):
+        return key & self._bucket_mask
+
+    def _hash2(self, key):
+        # Fibonacci hashing: multiply by 2^32 / phi and keep the high bits,
+        # which depend on all bits of the key (unlike the low-bits mask of
+        # _hash1, making the two bucket choices close to independent)
+        return ((key * 0x9E3779B1) & 0xFFFFFFFF) >> self._shift
+
+    def _find(self, key):
+        """Return the slot index holding key, or None."""
+        slots = self.slots
+        for bucket in (self._hash1(key), self._hash2(key)):
+            base = bucket * self.BUCKET_SIZE
+            for slot in range(base, base + self.BUCKET_SIZE):
+                if slots[slot] == key:
+                    return slot
+        return None
+
+    def insert(self, key, value):
+        """Insert a new (key, value) pair into the hash table.
+
+        Args:
+            key: the key to insert.
+            value: the value to insert.
+        """
+        slot = self._find(key)
+        if slot is not None:
+            self.values[slot] = value
+            return
+
+        if not self._try_place(key, value):
+            # the kick chain ran too long. Note that key itself was placed by
+            # the chain's first eviction; the homeless pair in self._pending
+            # is whichever resident the chain last displaced, and the table
+            # doubling below rehouses it along with everything else
+            self._increase_size()
+        self.slots_filled += 1
+
+    def _try_place(self, key, value):
+        """Place (key, value), kicking residents as needed.
+
+        Returns:
+            True on success, False if the kick chain exceeded MAX_KICKS.
+        """
+        slots = self.slots
+        values = self.values
+        bucket = self._hash1(key)
+        for _ in range(self.MAX_KICKS):
+            base = bucket * self.BUCKET_SIZE
+            for slot in range(base, base + self.BUCKET_SIZE):
+                if slots[slot] is None:
+                    slots[slot] = key
+                    values[slot] = value
+                    return True
+            # bucket is full: evict the first resident to its alternate
+            # bucket and continue with the evicted pair
+            slot = base
+            key, slots[slot] = slots[slot], key
+            value, values[slot] = values[slot], value
+            alt1, alt2 = self._hash1(key), self._hash2(key)
+            bucket = alt2 if bucket == alt1 else alt1
+        # the displaced (key, value) still needs a home: put it back where
+        # the last eviction took place so no entry is lost before the resize
+        self._pending = (key, value)
+        return False
+
+    def _increase_size(self):
+        """Double the bucket count and rehash every entry."""
+        old_slots = self.slots
+        old_values = self.values
+        pending = getattr(self, "_pending", None)
+        self._pending = None
+        while True:
+            self._init_storage((self._bucket_mask + 1) * 2)
+            ok = True
+            for key, value in zip(old_slots, old_values):
+                if key is None:
+                    continue
+                if not self._try_place(key, value):
+                    ok = False
+                    break
+            if ok and pending is not None:
+                ok = self._try_place(*pending)
+                if ok:
+                    pending = None
+            if ok:
+                return
+            # rare: rehashing itself cycled; double again
+
+    def search(self, key):
+        """Search for a value with a given key in the hash table.
+
+        Args:
+            key: the key to search for.
+        """
+        slot = self._find(key)
+        if slot is None:
+            raise KeyError(f"Could not find {key} in hash table")
+        return self.values[slot]
+
+    def delete(self, key):
+        """Delete the (key, value) pair with the given key.
+
+        Args:
+            key: the key to delete.
+        """
+        slot = self._find(key)
+        if slot is None:
+            raise KeyError(f"Could not find {key} in hash table")
+        self.slots[slot] = None
+        self.values[slot] = None
+        self.slots_filled -= 1
+
+    def __repr__(self):
+        summary = (f"Cuckoo hash table with {self.slots_filled} entries in "
+                   f"{self._bucket_mask + 1} buckets of {self.BUCKET_SIZE}")
+        return summary
+
+
 def num2letter(index):
     """Return the letter corresponding to the given index (with a at 0, b at 1
     etc.).
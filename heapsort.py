@@ -51,16 +51,26 @@ def parent(i: int) -> int:
 
 
 def max_heapify(A: list, heap_size: int, i: int):
-    left = left_child(i)
-    right = right_child(i)
-    max_i = i
-    if left < heap_size and A[left] > A[max_i]:
-        max_i = left
-    if right < heap_size and A[right] > A[max_i]:
-        max_i = right
-    if max_i != i:
+    # iterative sift-down with the child index computations inlined: each
+    # level costs one loop iteration rather than a fresh Python frame plus
+    # two helper calls (left_child/right_child remain above for reference).
+    # In the common case (both children in bounds) the larger child is
+    # selected with a single conditional expression and compared against the
+    # parent once - two data comparisons per level, with the hard-to-predict
+    # child-vs-parent branches collapsed into value selections
+    while True:
+        left = 2 * i + 1
+        right = left + 1
+        if right < heap_size:
+            max_i = left if A[left] > A[right] else right
+            if A[i] >= A[max_i]:
+                return
+        elif left < heap_size and A[left] > A[i]:
+            max_i = left
+        else:
+            return
         A[i], A[max_i] = A[max_i], A[i]
-        max_heapify(A, heap_size, max_i)
+        i = max_i
 
 
 def build_max_heap(A):
@@ -69,8 +79,27 @@ def build_max_heap(A):
         max_heapify(A, heap_size, i)
 
 
-def heapsort(A):
-    """An in-place implementation of heapsort."""
+def heapsort(A, fast: bool = False):
+    """An in-place implementation of heapsort.
+
+    Args:
+        A: the list to sort in place.
+        fast: when True, delegate to NumPy's C-level heapsort (an equivalent
+            algorithm, around two to three orders of magnitude faster on
+            large numeric arrays). The import is deferred so NumPy remains
+            an optional dependency; without it we quietly use the
+            pure-Python teaching path below.
+    """
+    if fast:
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+        if np is not None:
+            arr = np.asarray(A)
+            arr.sort(kind="heapsort")
+            A[:] = arr.tolist()
+            return
     build_max_heap(A)
     heap_size = len(A)
     while heap_size > 1:
@@ -79,6 +108,75 @@ def heapsort(A):
         max_heapify(A, heap_size, 0)
 
 
+# cache for the optional Numba-compiled kernel
+_jit_kernel = None
+
+
+def heapsort_numba(A: list):
+    """Sort A in place with a Numba-compiled heapsort over an int64 array.
+
+    The pure-Python heapsort above pays interpreter dispatch and PyObject
+    boxing per comparison and swap; compiled over a typed NumPy buffer the
+    inner sift-down becomes a handful of native instructions. We only
+    perform the imports here so that NumPy and Numba remain optional
+    dependencies (as with pygraphviz in btree.py); the compiled kernel is
+    cached after the first call.
+
+    Args:
+        A: the list of integers to sort in place.
+    """
+    global _jit_kernel
+    import numpy as np
+
+    if _jit_kernel is None:
+        from numba import njit
+
+        @njit(cache=True, boundscheck=False)
+        def kernel(a):
+            n = a.shape[0]
+            heap_size = n
+            # build the max-heap
+            for start in range(n // 2 - 1, -1, -1):
+                i = start
+                while True:
+                    left = 2 * i + 1
+                    right = 2 * i + 2
+                    max_i = i
+                    if left < heap_size and a[left] > a[max_i]:
+                        max_i = left
+                    if right < heap_size and a[right] > a[max_i]:
+                        max_i = right
+                    if max_i == i:
+                        break
+                    a[i], a[max_i] = a[max_i], a[i]
+                    i = max_i
+            # repeatedly move the maximum to the end and sift down
+            while heap_size > 1:
+                a[0], a[heap_size - 1] = a[heap_size - 1], a[0]
+                heap_size -= 1
+                i = 0
+                while True:
+                    left = 2 * i + 1
+                    right = 2 * i + 2
+                    max_i = i
+                    if left < heap_size and a[left] > a[max_i]:
+                        max_i = left
+                    if right < heap_size and a[right] > a[max_i]:
+                        max_i = right
+                    if max_i == i:
+                        break
+                    a[i], a[max_i] = a[max_i], a[i]
+                    i = max_i
+
+        # trigger compilation once, away from the first real workload
+        kernel(np.empty(0, dtype=np.int64))
+        _jit_kernel = kernel
+
+    arr = np.asarray(A, dtype=np.int64)
+    _jit_kernel(arr)
+    A[:] = arr.tolist()
+
+
 def naive_heapsort(A):
     """A naive implementation of heapsort that requires additional memory"""
     build_max_heap(A)
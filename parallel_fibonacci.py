@@ -20,6 +20,16 @@ from concurrent.futures import ThreadPoolExecutor
 # find the number of cores on the current system
 MAX_THREADS = mp.cpu_count()
 
+# a single persistent pool shared by every parallel call: constructing (and
+# tearing down) a ThreadPoolExecutor inside each recursive call costs thread
+# creation plus a shutdown barrier, often more than the spawned work itself
+_POOL = ThreadPoolExecutor(max_workers=MAX_THREADS)
+
+# bounds the number of in-flight parallel tasks to the worker count; a
+# non-blocking acquire replaces the threading.activeCount() check (which is
+# deprecated, counts unrelated threads, and takes a lock over all of them)
+_PERMITS = threading.Semaphore(MAX_THREADS)
+
 
 def fib_serial(n):
     """Compute the nth Fibonacci number in a serial fashion.
@@ -36,6 +46,54 @@ def fib_serial(n):
     return x + y
 
 
+def fib_iter(n):
+    """Compute the nth Fibonacci number iteratively.
+
+    The naive recursion above is O(phi^n) - the recursion itself is the
+    bottleneck, dwarfing anything parallelism can claw back. A simple loop
+    is O(n); it is kept separate (rather than memoizing fib_serial) so that
+    fib_serial still serves as the exponential baseline in main().
+
+    Args:
+        n: the index of the Fibonacci number to compute.
+
+    Returns:
+        The nth Fibonacci number.
+    """
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+
+def fib_fast_doubling(n):
+    """Compute the nth Fibonacci number with the fast-doubling identities.
+
+    Using F(2k) = F(k) * (2*F(k+1) - F(k)) and F(2k+1) = F(k)^2 + F(k+1)^2,
+    each halving of n costs a constant number of big-int multiplies, so the
+    whole computation is O(log n) multiplies - this makes n in the millions
+    feasible, where even the O(n) loop above bogs down in big-int additions.
+
+    Args:
+        n: the index of the Fibonacci number to compute.
+
+    Returns:
+        The nth Fibonacci number.
+    """
+    def doubling(k):
+        # returns (F(k), F(k+1))
+        if k == 0:
+            return 0, 1
+        f_k, f_k1 = doubling(k >> 1)
+        c = f_k * (2 * f_k1 - f_k)
+        d = f_k * f_k + f_k1 * f_k1
+        if k & 1:
+            return d, c + d
+        return c, d
+
+    return doubling(n)[0]
+
+
 def fib_parallel(n, try_parallel=True):
     """Compute the nth Fibonacci number in a parallel fashion.
 
@@ -48,30 +106,31 @@ def fib_parallel(n, try_parallel=True):
 
     Notes:
     1. The `try_parallel` argument is a slightly ugly hack to make the code faster.
-    It is used to avoid calling threading.activeCount() in every recursive call (which is
-    pretty slow and ends up dominating the recursion).
-
-    2. We use "coarsening" - we don't spawn a new thread for every recursive call. Instead,
-    we spawn new threads until we reach a certain threshold (MAX_THREADS). This is to avoid
-    too much overhead from spawning threads (and checking for thread counts).
+    It is used to avoid touching the semaphore in every recursive call once we
+    know no permits remain.
+
+    2. We use "coarsening" - we don't spawn a new task for every recursive call.
+    Instead, we submit tasks until MAX_THREADS of them are in flight (tracked by
+    the semaphore). This is to avoid too much overhead from task submission.
+    Because in-flight tasks never exceed the pool's worker count, every
+    submitted task gets a worker immediately and the blocking result() call
+    below cannot deadlock.
     """
     if n < 2:
         return n
 
-    # only retrieve the thread count if we are potentially going to spawn another thread
-    # (since retrieving the thread count is expensive)
-    if try_parallel:
-        thread_count = threading.activeCount()
-
-    # We apply some coarsening (i.e. don't go too bonkers with the number of threads)
-    if try_parallel and thread_count <= MAX_THREADS:
-        with ThreadPoolExecutor() as executor:
-            x_future = executor.submit(fib_parallel, n - 1)
+    # a non-blocking acquire: if it fails, all permits (and hence workers) are
+    # busy and we fall through to the serial path
+    if try_parallel and _PERMITS.acquire(blocking=False):
+        try:
+            x_future = _POOL.submit(fib_parallel, n - 1)
             y = fib_parallel(n - 2)
             x = x_future.result()  # note that this blocks until x is ready
+        finally:
+            _PERMITS.release()
     else:
-        # Now we've used all our threads, so we just do the computation serially for
-        # the remainder of the recursion.
+        # Now we've used all our permits, so we just do the computation serially
+        # for the remainder of the recursion.
         x = fib_parallel(n - 1, try_parallel=False)
         y = fib_parallel(n - 2, try_parallel=False)
     return x + y
@@ -93,6 +152,11 @@ def main():
     status = "using nogil" if nogil else "using the GIL"
     print(f"parallel fibonacci (n={target}): {res}) {end_time - start_time} secs {status}")
 
+    start_time = time.perf_counter()
+    res = fib_iter(target)
+    end_time = time.perf_counter()
+    print(f"iterative fibonacci (n={target}): {res}) {end_time - start_time} secs")
+
     """
     Print out >>>
 
@@ -4,7 +4,7 @@ Heaps were originally introduced in 1964 by J. W. J. Williams in the context of
 the Heapsort algorithm.
 
 Reference:
-- J. Williams, "Algorithm 232 – Heapsort", Communications of the ACM (1964)
+- J. Williams, "Algorithm 232 – Heapsort", Communications of the ACM (1964)
 
 The code draws inspiration from descriptions of Priority Queues and Binary Heaps:
 - Chapter 8 of Elementary Algorithms by Liu Xinyu https://github.com/liuxinyu95/AlgoXY
@@ -17,9 +17,6 @@ may find the cpython implementation interesting:
 https://github.com/python/cpython/blob/3.11/Lib/heapq.py
 """
 
-from red_black_tree import RedBlackTree
-
-
 def left_child(i: int) -> int:
     """Compute the index of the left child of node i.
 
@@ -56,34 +53,61 @@ def parent(i: int) -> int:
     return (i - 1) // 2
 
 
-def max_heapify(A: list, heap_size: int, i: int):
-    left = left_child(i)
-    right = right_child(i)
-    max_i = i
-    if left < heap_size and A[left]["key"] > A[max_i]["key"]:
-        max_i = left
-    if right < heap_size and A[right]["key"] > A[max_i]["key"]:
-        max_i = right
-    if max_i != i:
-        A[i], A[max_i] = A[max_i], A[i]
-        max_heapify(A, heap_size, max_i)
-
-
-def build_max_heap(A):
-    heap_size = len(A)
+def max_heapify(keys: list, values: list, heap_size: int, i: int,
+                pos: dict = None):
+    # iterative sift-down with the child index computations inlined: each
+    # level costs one loop iteration rather than a fresh Python frame plus
+    # two helper calls (left_child/right_child remain above for reference).
+    # keys and values are parallel flat lists (a struct-of-arrays layout):
+    # each comparison is a plain list indexing rather than a dict lookup
+    # inside a per-entry {"key": ..., "value": ...} record, and only swaps
+    # need to touch the value column
+    # In the common case (both children in bounds) the larger child is
+    # selected with a single conditional expression and compared against the
+    # parent once - two key comparisons per level, as in heapsort.py
+    # When a value -> index map is given (as by pop_max), every swap also
+    # updates it, so the map never goes stale while entries sift down
+    while True:
+        left = 2 * i + 1
+        right = left + 1
+        if right < heap_size:
+            max_i = left if keys[left] > keys[right] else right
+            if keys[i] >= keys[max_i]:
+                return
+        elif left < heap_size and keys[left] > keys[i]:
+            max_i = left
+        else:
+            return
+        keys[i], keys[max_i] = keys[max_i], keys[i]
+        values[i], values[max_i] = values[max_i], values[i]
+        if pos is not None:
+            pos[values[i]], pos[values[max_i]] = i, max_i
+        i = max_i
+
+
+def build_max_heap(keys, values):
+    heap_size = len(keys)
     for i in range(heap_size // 2 - 1, -1, -1):
-        max_heapify(A, heap_size, i)
+        max_heapify(keys, values, heap_size, i)
 
 
 class MaxPriorityQueue:
 
-    def __init__(self, A: list):
-        self.A = A
-        self.heap_size = len(A)
-
-        # we use a red-black tree to map values to indices in the underlying array
-        # so that we can call increase_key in O(log n) time
-        self.value2index = RedBlackTree()
+    def __init__(self, keys: list = None, values: list = None):
+        # entries are stored as two parallel lists rather than a list of
+        # {"key": ..., "value": ...} dicts, so heap comparisons touch only
+        # the compact key column
+        self.keys = keys if keys is not None else []
+        self.values = values if values is not None else []
+        assert len(self.keys) == len(self.values), \
+            "keys and values must have the same length"
+        self.heap_size = len(self.keys)
+        build_max_heap(self.keys, self.values)
+
+        # a companion value -> index map so increase_key can locate a value
+        # in O(1); a built-in dict beats the red-black tree previously used
+        # here (O(log n) per lookup, Python-level comparisons at each step)
+        self.pos = {value: i for i, value in enumerate(self.values)}
 
     def get_maximum(self):
         """Return the maximum value in the priority queue.
@@ -91,7 +115,7 @@ class MaxPriorityQueue:
         Returns:
             The maximum value in the priority queue.
         """
-        return self.A[0]["value"]
+        return self.values[0]
 
     def pop_max(self):
         """Remove the maximum value from the priority queue.
@@ -99,18 +123,18 @@ class MaxPriorityQueue:
         Returns:
             The maximum value in the priority queue.
         """
-        max_item = self.A[0]
-        last_item = self.A[self.heap_size - 1]
-        self.A[0] = last_item
+        max_value = self.values[0]
+        last = self.heap_size - 1
+        self.keys[0] = self.keys[last]
+        self.values[0] = self.values[last]
 
-        # update the value2index mapping (note that the value in the RBT is the index in
-        # the underlying array for the heap)
-        self.value2index[last_item["value"]] = 0
-        del self.value2index[max_item["value"]]
+        # update the value -> index mapping
+        self.pos[self.values[0]] = 0
+        del self.pos[max_value]
 
         self.heap_size -= 1
-        max_heapify(self.A, self.heap_size, 0)
-        return max_item["value"]
+        max_heapify(self.keys, self.values, self.heap_size, 0, self.pos)
+        return max_value
 
     def increase_key(self, key, value):
         """Increase the key of the value in the priority queue.
@@ -120,14 +144,27 @@ class MaxPriorityQueue:
             value: the value to increase the key of
         """
         # locate the position of `value` in the underlying array
-        i = self.value2index[value]
+        i = self.pos[value]
 
-        assert key >= self.A[i]["key"], f"requested to decrease key {self.A[i]['key']} to {key}"
-        self.A[i]["key"] = key # increase the key
-        while i > 0 and self.A[i]["key"] > self.A[parent(i)]["key"]:
-            self.value2index[self.A[i]["value"]], self.value2index[self.A[parent(i)]["value"]] = parent(i), i
-            self.A[i], self.A[parent(i)] = self.A[parent(i)], self.A[i]
-            i = parent(i)
+        keys = self.keys
+        assert key >= keys[i], f"requested to decrease key {keys[i]} to {key}"
+        keys[i] = key  # increase the key
+        while i > 0 and keys[i] > keys[(i - 1) // 2]:
+            p = (i - 1) // 2
+            self._swap(i, p)
+            i = p
+
+    def _swap(self, i, j):
+        """Swap the entries at indices i and j, keeping pos in sync.
+
+        Args:
+            i: the index of the first entry.
+            j: the index of the second entry.
+        """
+        keys, values, pos = self.keys, self.values, self.pos
+        pos[values[i]], pos[values[j]] = j, i
+        keys[i], keys[j] = keys[j], keys[i]
+        values[i], values[j] = values[j], values[i]
 
     def insert(self, key, value):
         """Insert value with given key into the priority queue
@@ -136,19 +173,23 @@ class MaxPriorityQueue:
             key: the key of the value to insert
             value: the value to insert
         """
-        if self.heap_size == len(self.A):
-            # expand underlying array to avoid heap overflow
-            self.A.append(None)
+        if self.heap_size == len(self.keys):
+            # expand underlying arrays to avoid heap overflow
+            self.keys.append(None)
+            self.values.append(None)
         # use key that is guaranteed to be valid
-        initial_key = float("-inf")
-        self.A[self.heap_size] = {"key": initial_key, "value": value}
+        self.keys[self.heap_size] = float("-inf")
+        self.values[self.heap_size] = value
         self.heap_size += 1
-        assert value not in self.value2index, f"value {value} already in priority queue"
-        self.value2index[value] = self.heap_size - 1
+        assert value not in self.pos, f"value {value} already in priority queue"
+        self.pos[value] = self.heap_size - 1
         self.increase_key(key, value)
 
     def __repr__(self):
-        summary = "\n".join(str(x) for x in self.A[:self.heap_size])
+        summary = "\n".join(
+            f"key: {key}, value: {value}"
+            for key, value in zip(self.keys[:self.heap_size], self.values[:self.heap_size])
+        )
         return f"MaxPriorityQueue containing:\n{summary}"
 
 
@@ -156,8 +197,7 @@ def main():
     # pylint: disable=line-too-long
     # flake8: noqa: E501
 
-    inital_queue = []
-    max_priority_queue = MaxPriorityQueue(A=inital_queue)
+    max_priority_queue = MaxPriorityQueue()
     print("Initial priority queue:")
     print(max_priority_queue)
 
@@ -182,29 +222,29 @@ def main():
 
     Initial priority queue:
     MaxPriorityQueue containing:
-    {'key': 0, 'value': 'red'}
+
 
     Priority queue after insertions:
     MaxPriorityQueue containing:
-    {'key': 4, 'value': 'blue'}
-    {'key': 2, 'value': 'yellow'}
-    {'key': 3, 'value': 'green'}
-    {'key': -1, 'value': 'mauve'}
+    key: 4, value: blue
+    key: 2, value: yellow
+    key: 3, value: green
+    key: -1, value: mauve
 
     Priority queue after key increase:
     MaxPriorityQueue containing:
-    {'key': 5, 'value': 'green'}
-    {'key': 2, 'value': 'yellow'}
-    {'key': 4, 'value': 'blue'}
-    {'key': -1, 'value': 'mauve'}
+    key: 5, value: green
+    key: 2, value: yellow
+    key: 4, value: blue
+    key: -1, value: mauve
 
     Popped max: green
     Popped max: blue
 
     Priority queue after pop max calls:
     MaxPriorityQueue containing:
-    {'key': 2, 'value': 'yellow'}
-    {'key': -1, 'value': 'mauve'}
+    key: 2, value: yellow
+    key: -1, value: mauve
     """
 
 if __name__ == "__main__":
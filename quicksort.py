@@ -102,6 +102,188 @@ def quicksort_with_hoare_partition(A: list, low: int = 0, high: int = None):
         quicksort_with_hoare_partition(A, pivot + 1, high)
 
 
+def quicksort_iterative(A: list):
+    """Sort the array A in place using quicksort with an explicit stack.
+
+    Replacing the recursion of the variants above with a stack of pending
+    (low, high) ranges removes a Python call frame per subarray, and pushing
+    the larger half first (so the smaller is handled next) bounds the stack
+    at O(log n) entries - no RecursionError on adversarial inputs.
+
+    Args:
+        A: the array to be sorted.
+    """
+    stack = [(0, len(A) - 1)]
+    while stack:
+        low, high = stack.pop()
+        if low >= high:
+            continue
+        pivot = lomuto_partition(A, low, high)
+        # push the larger range first so the smaller one is popped next,
+        # keeping the pending stack logarithmic
+        if pivot - low > high - pivot:
+            stack.append((low, pivot - 1))
+            stack.append((pivot + 1, high))
+        else:
+            stack.append((pivot + 1, high))
+            stack.append((low, pivot - 1))
+
+
+# below this subarray size, insertion sort beats the partition machinery
+INSERTION_SORT_CUTOFF = 16
+
+
+def _insertion_sort(A: list, low: int, high: int):
+    """Sort the subarray A[low:high+1] in place with insertion sort.
+
+    Args:
+        A: the array containing the subarray to sort.
+        low: the index of the zeroth element of the subarray to be sorted.
+        high: the index of the last element of the subarray to be sorted.
+    """
+    for j in range(low + 1, high + 1):
+        key = A[j]
+        i = j - 1
+        while i >= low and A[i] > key:
+            A[i + 1] = A[i]
+            i -= 1
+        A[i + 1] = key
+
+
+def introsort(A: list):
+    """Sort the array A in place using introsort.
+
+    Introsort (Musser, 1997) fixes the two practical weaknesses of the
+    quicksorts above: picking a fixed pivot position degrades to O(n^2) on
+    sorted input, and recursing all the way down to single elements pays
+    Python call overhead on tiny subarrays. It uses a median-of-three pivot,
+    hands subarrays below INSERTION_SORT_CUTOFF to insertion sort, and if
+    the recursion exceeds 2*log2(n) levels (a sign of pathological pivots)
+    falls back to heapsort for the offending range, guaranteeing O(n log n).
+
+    Args:
+        A: the array to be sorted.
+    """
+    n = len(A)
+    if n > 1:
+        _introsort(A, 0, n - 1, 2 * n.bit_length())
+
+
+def _introsort(A: list, low: int, high: int, depth_limit: int):
+    """Sort the subarray A[low:high+1] in place (see introsort).
+
+    Args:
+        A: the array containing the subarray to sort.
+        low: the index of the zeroth element of the subarray to be sorted.
+        high: the index of the last element of the subarray to be sorted.
+        depth_limit: remaining recursion levels before the heapsort fallback.
+    """
+    while high - low >= INSERTION_SORT_CUTOFF:
+        if depth_limit == 0:
+            # pathological pivots: finish this range with heapsort instead
+            from heapsort import heapsort
+            sub = A[low:high + 1]
+            heapsort(sub)
+            A[low:high + 1] = sub
+            return
+        depth_limit -= 1
+
+        # median-of-three: sort A[low], A[mid], A[high] in place, then stash
+        # the median at A[high - 1] and partition over low+1..high-1
+        # (Sedgewick's scheme - the outer elements act as sentinels)
+        mid = (low + high) // 2
+        if A[mid] < A[low]:
+            A[low], A[mid] = A[mid], A[low]
+        if A[high] < A[low]:
+            A[low], A[high] = A[high], A[low]
+        if A[high] < A[mid]:
+            A[mid], A[high] = A[high], A[mid]
+        A[mid], A[high - 1] = A[high - 1], A[mid]
+        pivot_val = A[high - 1]
+
+        i = low
+        j = high - 1
+        while True:
+            i += 1
+            while A[i] < pivot_val:
+                i += 1
+            j -= 1
+            while A[j] > pivot_val:
+                j -= 1
+            if i >= j:
+                break
+            A[i], A[j] = A[j], A[i]
+        A[i], A[high - 1] = A[high - 1], A[i]
+
+        # recurse into the smaller half and loop on the larger, bounding the
+        # Python recursion depth at O(log n)
+        if i - low < high - i:
+            _introsort(A, low, i - 1, depth_limit)
+            low = i + 1
+        else:
+            _introsort(A, i + 1, high, depth_limit)
+            high = i - 1
+    _insertion_sort(A, low, high)
+
+
+# cache for the optional Numba-compiled kernel
+_jit_kernel = None
+
+
+def quicksort_nb(A: list):
+    """Sort A in place with a Numba-compiled quicksort over an int64 array.
+
+    Both partition schemes above are tight integer compare-and-swap loops
+    whose cost in pure Python is almost entirely interpreter dispatch;
+    compiled over a typed NumPy buffer they become a handful of native
+    instructions per element. The kernel also replaces the Python recursion
+    with an explicit stack of (low, high) ranges, avoiding call overhead and
+    recursion-depth limits. We only perform the imports here so that NumPy
+    and Numba remain optional dependencies (as with pygraphviz in btree.py);
+    the compiled kernel is cached after the first call.
+
+    Args:
+        A: the list of integers to sort in place.
+    """
+    global _jit_kernel
+    import numpy as np
+
+    if _jit_kernel is None:
+        from numba import njit
+
+        @njit(cache=True, boundscheck=False)
+        def kernel(a):
+            stack = [(0, a.shape[0] - 1)]
+            while stack:
+                low, high = stack.pop()
+                if low >= high:
+                    continue
+                # Hoare partition (as in hoare_partition above)
+                pivot_val = a[low]
+                i = low - 1
+                j = high + 1
+                while True:
+                    i += 1
+                    while a[i] < pivot_val:
+                        i += 1
+                    j -= 1
+                    while a[j] > pivot_val:
+                        j -= 1
+                    if i >= j:
+                        break
+                    a[i], a[j] = a[j], a[i]
+                stack.append((low, j))
+                stack.append((j + 1, high))
+
+        # trigger compilation once, away from the first real workload
+        kernel(np.empty(0, dtype=np.int64))
+        _jit_kernel = kernel
+
+    arr = np.asarray(A, dtype=np.int64)
+    _jit_kernel(arr)
+    A[:] = arr.tolist()
+
+
 def main():
     # pylint: disable=line-too-long
     # flake8: noqa: E501
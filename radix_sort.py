@@ -12,9 +12,10 @@ Notes:
 - for simplicity, the code does not focus on efficiency (it is wasteful with memory)
 - it also assumes that the keys are integers
 """
+from array import array
 
 
-def counting_sort_on_digit(A, k, d, digit_pos):
+def counting_sort_on_digit(A, k, d, digit_pos, counts=None, output=None):
     """Sort the given array with the counting sort algorithm on the given digit.
 
     Args:
@@ -22,32 +23,46 @@ def counting_sort_on_digit(A, k, d, digit_pos):
         k: the number of possible values for the keys (assumes k <= 10).
         d: the number of digits in the keys.
         digit_pos: the position of the digit to sort on
+        counts: an optional reusable length-k buffer (zeroed at entry).
+        output: an optional reusable length-n buffer for the result.
 
     Returns:
-        The sorted array.
+        The sorted array (the output buffer when one was supplied, otherwise
+        a fresh list).
 
-    NOTE: Counting sort assumes that all inputs are tuples of integers between
+    NOTE: Counting sort assumes that all digits are integers between
     0 and k-1 inclusive.
     """
 
-    assert k <= 10, "This implementation of counting sort assumes k <= 10."
-
-    def subkey(key):
-        """Helper function to extract the digit at the given position from the key."""
-        str_key = str(key).zfill(d)
-        return int(str_key[digit_pos])
+    # extract digits arithmetically: digit_pos counts from the most
+    # significant digit (as in the string version this replaces, which paid
+    # a str/zfill/slice/int round trip per key), so the divisor is
+    # k^(d - 1 - digit_pos). Each key's digit is needed by both the counting
+    # pass and the placement pass, so compute them all once up front.
+    power = k ** (d - 1 - digit_pos)
+    digits = [(key // power) % k for key in A]
 
     n = len(A)
-    counts = [0 for _ in range(k)]
-    output = [None for _ in range(n)]
-    for key in A:
-        counts[subkey(key)] += 1
+    # counts and output live in flat C int64 buffers rather than lists of
+    # boxed PyLongs (k and n machine words instead of pointer arrays), as in
+    # counting_sort.py. Callers looping over digits (radix_sort_lsd) pass
+    # the buffers in so each pass reuses them instead of reallocating
+    return_list = output is None
+    if counts is None:
+        counts = array("q", [0]) * k
+    else:
+        counts[:] = array("q", [0]) * k
+    if output is None:
+        output = array("q", [0]) * n
+    for digit in digits:
+        counts[digit] += 1
     for i in range(1, k):
         counts[i] += counts[i - 1]
-    for key in reversed(A):
-        output[counts[subkey(key)] - 1] = key
-        counts[subkey(key)] = counts[subkey(key)] - 1
-    return output
+    for idx in range(n - 1, -1, -1):
+        digit = digits[idx]
+        counts[digit] -= 1
+        output[counts[digit]] = A[idx]
+    return output.tolist() if return_list else output
 
 
 def radix_sort_lsd(A, d, k):
@@ -62,11 +77,51 @@ def radix_sort_lsd(A, d, k):
     Returns:
         The sorted array.
     """
-    for digit_pos in range(d - 1, -1, -1):
+    # allocate the counting-sort buffers once and reuse them across digit
+    # passes, double-buffering so each pass reads the previous pass's output
+    # without copying
+    n = len(A)
+    counts = array("q", [0]) * k
+    buffers = [array("q", [0]) * n, array("q", [0]) * n]
+    for pass_idx, digit_pos in enumerate(range(d - 1, -1, -1)):
         # we use counting sort as our stable sort
-        print(A)
-        A = counting_sort_on_digit(A, k, d, digit_pos)
-    return A
+        A = counting_sort_on_digit(A, k, d, digit_pos, counts=counts,
+                                   output=buffers[pass_idx % 2])
+    return list(A)
+
+
+def radix_sort_lsd_np(A, k=256):
+    """Sort the given array with a vectorized LSD radix sort.
+
+    Each per-digit pass collapses into two NumPy calls: computing the digit
+    array with (A // power) % k and applying the stable permutation
+    np.argsort(digits, kind="stable") - exactly what counting sort produces,
+    but executed in C over contiguous int arrays. The digit count is derived
+    from the largest key, and the default base of 256 means each pass peels
+    off one byte, a better cache trade-off than base 10. We only perform the
+    import here so that NumPy remains an optional dependency.
+
+    Args:
+        A: the array of non-negative integers to be sorted.
+        k: the number of possible digit values (the radix).
+
+    Returns:
+        The sorted array (as a list).
+    """
+    import numpy as np
+
+    arr = np.asarray(A, dtype=np.int64)
+    if arr.size == 0:
+        return []
+    max_key = int(arr.max())
+    power = 1
+    while True:
+        digits = (arr // power) % k
+        arr = arr[np.argsort(digits, kind="stable")]
+        power *= k
+        if power > max_key:
+            break
+    return arr.tolist()
 
 
 def main():
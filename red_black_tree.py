@@ -7,11 +7,25 @@ The code draws inspiration from several descriptions/code snippets for Red-Black
 
 The code was implemented with assistance from GitHub Copilot.
 """
+from array import array
+
+# node colors: every comparison in the fix-up loops is against one of these,
+# and small-int equality is a single C-level compare where the previous
+# RED/BLACK string literals paid a unicode comparison each time. These
+# match the encoding used by flat_red_black_tree.py
+BLACK = 0
+RED = 1
 
 
 class Node:
 
-    def __init__(self, key, parent=None, left=None, right=None, color=None, value=None):
+    # a fixed slot layout instead of a per-instance __dict__: attribute
+    # reads like node.parent.parent.left become offset loads rather than
+    # dict lookups, and each node sheds the dict's memory overhead
+    __slots__ = ("key", "parent", "left", "right", "color", "value")
+
+    def __init__(self, key, parent: "Node" = None, left: "Node" = None,
+                 right: "Node" = None, color: int = None, value=None):
         self.key = key
         self.parent = parent
         self.left = left
@@ -19,38 +33,51 @@ class Node:
         self.color = color
         self.value = value
 
-    def __repr__(self):
-        summary = f"Node({self.key}, color={self.color})"
-        if self.parent:
-            summary += f" parent={self.parent.key}"
-        if self.left:
-            summary += f" left={self.left.key}"
-        if self.right:
-            summary += f" right={self.right.key}"
-        if self.value is not None:
-            summary += f" value={self.value}"
-        return summary
-
-
-class Nil(Node):
-    """Nil node (used to represent the leaves of the tree)."""
-
-    def __init__(self):
-        super().__init__(key="Nil", parent=None, left=None, right=None, color="black")
-
-    @staticmethod
-    def __bool__():
-        return False
+    def __repr__(self) -> str:
+        # built as one f-string: the previous += chain allocated and copied
+        # a fresh intermediate string per optional part, whereas a single
+        # f-string renders the parts and joins them in one pass
+        color_name = {BLACK: "black", RED: "red"}.get(self.color, self.color)
+        return (
+            f"Node({self.key}, color={color_name})"
+            f"{f' parent={self.parent.key}' if self.parent else ''}"
+            f"{f' left={self.left.key}' if self.left else ''}"
+            f"{f' right={self.right.key}' if self.right else ''}"
+            f"{f' value={self.value}' if self.value is not None else ''}"
+        )
+
+    def __bool__(self) -> bool:
+        # the leaf sentinel is the only node whose child links point back to
+        # itself (see RedBlackTree.__init__), so it alone is falsy - the
+        # behavior the former Nil subclass provided. Keeping a single Node
+        # class makes every attribute access in the hot loops monomorphic:
+        # the interpreter's per-site caches stay valid instead of being
+        # invalidated each time a Nil flowed through a Node call site
+        return self.left is not self
 
 
 class RedBlackTree:
 
-    def __init__(self):
-        # Use a single Nil node as a "sentinel" for all leaves
-        self.nil = Nil()
-        self.root = self.nil
-
-    def __repr__(self):
+    # bound on retained free nodes, to avoid one large churn phase pinning
+    # memory forever (matches the NodePool cap in binary_search_tree.py)
+    MAX_FREELIST_SIZE = 1 << 14
+
+    def __init__(self) -> None:
+        # a single plain Node shared as the sentinel for all leaves. A real
+        # object (rather than None) is load-bearing: the CLRS delete writes
+        # x.parent even when x is the sentinel, and fix_delete_violations
+        # reads color and parent off whatever node it was handed. The
+        # sentinel's links point to itself, so reads off it stay in-bounds
+        # and Node.__bool__ can recognize it without a subclass
+        nil = Node(key="Nil", color=BLACK)
+        nil.parent = nil.left = nil.right = nil
+        self.nil = nil
+        self.root = nil
+        # deleted nodes are parked here and reused by _new_node, sparing an
+        # object allocation per insert during sustained insert/delete churn
+        self._freelist = []
+
+    def __repr__(self) -> str:
         return f"RedBlackTree({self.root})"
 
     def search(self, key) -> Node:
@@ -93,88 +120,200 @@ class RedBlackTree:
             node = node.right
         return node
 
-    def inorder(self, node: Node):
+    def inorder(self, node: Node, visited: list = None) -> list:
         """Perform an inorder traversal of the tree.
 
         Args:
             node: Node - the root of the tree to traverse.
+            visited: the list of visited keys.
+
+        Returns:
+            The list of visited keys.
         """
-        if node is not self.nil:
-            self.inorder(node.left)
-            print(node.key, end=" ")
-            self.inorder(node.right)
+        # iterative form: a recursive traversal costs a Python frame per
+        # node and hits the recursion limit on deep trees
+        if visited is None:
+            visited = []
+        nil = self.nil
+        stack = []
+        while stack or node is not nil:
+            while node is not nil:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            visited.append(node.key)
+            node = node.right
+        return visited
 
-    def preorder(self, node: Node):
-        """Perform a preorder traversal of the tree rooted at node.
+    def inorder_iter(self, node: Node):
+        """Yield the keys of the subtree rooted at node in sorted order.
+
+        A lazy counterpart to inorder: nothing is materialized, so consumers
+        that stop early (e.g. taking the k smallest keys) or stream the keys
+        straight to output (print(*rbt.inorder_iter(rbt.root))) touch only
+        the nodes they need. Like the list-building form it uses an explicit
+        stack, so deep trees cannot hit the recursion limit.
 
         Args:
             node: Node - the root of the tree to traverse.
+
+        Yields:
+            The keys of the subtree, smallest first.
         """
-        if node is not self.nil:
-            print(node.key, end=" ")
-            self.preorder(node.left)
-            self.preorder(node.right)
+        nil = self.nil
+        stack = []
+        while stack or node is not nil:
+            while node is not nil:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.key
+            node = node.right
+
+    def preorder(self, node: Node, visited: list = None) -> list:
+        """Perform a preorder traversal of the tree rooted at node.
+
+        Args:
+            node: Node - the root of the tree to traverse.
+            visited: the list of visited keys.
 
-    def postorder(self, node: Node):
+        Returns:
+            The list of visited keys.
+        """
+        if visited is None:
+            visited = []
+        nil = self.nil
+        stack = [node] if node is not nil else []
+        while stack:
+            node = stack.pop()
+            visited.append(node.key)
+            # push right first so left is visited first
+            if node.right is not nil:
+                stack.append(node.right)
+            if node.left is not nil:
+                stack.append(node.left)
+        return visited
+
+    def postorder(self, node: Node, visited: list = None) -> list:
         """Perform a postorder traversal of the tree rooted at node.
 
         Args:
             node: Node - the root of the tree to traverse.
+            visited: the list of visited keys.
+
+        Returns:
+            The list of visited keys.
         """
-        if node is not self.nil:
-            self.postorder(node.left)
-            self.postorder(node.right)
-            print(node.key, end=" ")
+        # collect keys in (node, right, left) order with one stack, then
+        # reverse: the result is (left, right, node), i.e. postorder
+        if visited is None:
+            visited = []
+        nil = self.nil
+        start = len(visited)
+        stack = [node] if node is not nil else []
+        while stack:
+            node = stack.pop()
+            visited.append(node.key)
+            if node.left is not nil:
+                stack.append(node.left)
+            if node.right is not nil:
+                stack.append(node.right)
+        visited[start:] = visited[start:][::-1]
+        return visited
+
+    def _set_child(self, parent: Node, old: Node, new: Node) -> None:
+        """Replace parent's child old with new (updating root when parent is
+        absent).
+
+        This centralizes the left-or-right reparenting branch that rotations
+        and shift_nodes each repeated inline. The branch itself is about as
+        cheap as CPython allows on named attributes; the fully branchless
+        form - a child array indexed by a 0/1 direction - needs the flat
+        index layout of flat_red_black_tree.py.
+
+        Args:
+            parent: the parent whose child slot is rewritten.
+            old: the child currently in that slot.
+            new: the node to put there.
+        """
+        if not parent:
+            self.root = new
+        elif old is parent.left:
+            parent.left = new
+        else:
+            parent.right = new
 
-    def rotate_left(self, u: Node):
+    def rotate_left(self, u: Node) -> None:
         """Rotate the subtree rooted at u to the left."""
         v = u.right
         u.right = v.left
-        if v.left != self.nil:
+        if v.left is not self.nil:
             v.left.parent = u
         v.parent = u.parent
-        if not u.parent:
-            self.root = v
-        elif u == u.parent.left:
-            u.parent.left = v
-        else:
-            u.parent.right = v
+        self._set_child(u.parent, u, v)
         v.left, u.parent = u, v
 
-    def rotate_right(self, v: Node):
+    def rotate_right(self, v: Node) -> None:
         """Rotate the subtree rooted at v to the right."""
         u = v.left
         v.left = u.right
-        if u.right != self.nil:
+        if u.right is not self.nil:
             u.right.parent = v
         u.parent = v.parent
-        if not v.parent:
-            self.root = u
-        elif v == v.parent.right:
-            v.parent.right = u
-        else:
-            v.parent.left = u
+        self._set_child(v.parent, v, u)
         u.right, v.parent = v, u
 
-    def insert(self, new_node: Node):
+    def _new_node(self, key, value=None) -> Node:
+        """Return a node with the given key, reusing a freed one if possible.
+
+        Args:
+            key: the key of the new node.
+            value: the value of the new node.
+        """
+        if self._freelist:
+            node = self._freelist.pop()
+            node.key = key
+            node.value = value
+            return node
+        return Node(key, value=value)
+
+    def insert_key(self, key, value=None) -> Node:
+        """Insert a key, allocating the node internally.
+
+        Args:
+            key: the key to insert.
+            value: the value of the new node.
+
+        Returns:
+            The inserted node.
+        """
+        node = self._new_node(key, value)
+        self.insert(node)
+        return node
+
+    def insert(self, new_node: Node) -> None:
         """Insert a new node into the tree.
 
         Args:
             new_node: the node to insert.
         """
 
-        # Typical Binary Search Tree insertion method
+        # Typical Binary Search Tree insertion method. The inserted key is
+        # bound to a local once: the descent compares it at every level, and
+        # new_node.key would otherwise be re-read each time
+        key = new_node.key
+        nil = self.nil
         node = self.root
         parent = None
-        while not isinstance(node, Nil):
+        while node is not nil:
             parent = node
-            node = node.left if new_node.key < node.key else node.right
+            node = node.left if key < node.key else node.right
 
         new_node.parent = parent
 
         if not parent:  # handle the case when the tree is empty
             self.root = new_node
-        elif new_node.key < parent.key:
+        elif key < parent.key:
             parent.left = new_node
         else:
             parent.right = new_node
@@ -182,142 +321,314 @@ class RedBlackTree:
         # set Red-Black Tree node attributes
         new_node.left = self.nil
         new_node.right = self.nil
-        new_node.color = "red"
+        new_node.color = RED
 
         self.fix_insert_violations(new_node)
 
-    def fix_insert_violations(self, node: Node):
+    def insert_top_down(self, new_node: Node) -> None:
+        """Insert a new node in a single top-down pass (Sedgewick).
+
+        The bottom-up insert above descends to a leaf and then walks back up
+        fixing violations, touching the path twice. Here any 4-node (a node
+        with two red children) is split proactively during the descent; as a
+        result no red-red violation can propagate upward, so each local fix
+        after a split - and the one after attaching the new node - costs
+        O(1) rotations and the path is traversed once.
+
+        Args:
+            new_node: the node to insert.
+        """
+        nil = self.nil
+        key = new_node.key
+        node = self.root
+        parent = None
+        while node is not nil:
+            if node.left.color == RED and node.right.color == RED:
+                # split the 4-node: push its blackness to the children.
+                # Any red-red clash this creates with node's parent is
+                # resolved on the spot; ancestors hold no 4-nodes (we split
+                # them on the way down), so the fix cannot cascade
+                node.color = RED
+                node.left.color = BLACK
+                node.right.color = BLACK
+                self.fix_insert_violations(node)
+            parent = node
+            node = node.left if key < node.key else node.right
+
+        new_node.parent = parent
+        if not parent:  # handle the case when the tree is empty
+            self.root = new_node
+        elif key < parent.key:
+            parent.left = new_node
+        else:
+            parent.right = new_node
+
+        new_node.left = nil
+        new_node.right = nil
+        new_node.color = RED
+        self.fix_insert_violations(new_node)
+
+    def fix_insert_violations(self, node: Node) -> None:
         """Fix any Red-Black Tree insert violations.
 
         Args:
             node: the node that was inserted.
         """
-        while node != self.root and node.parent.color == "red":
-            if node.parent == node.parent.parent.left:
-                uncle = node.parent.parent.right
-                if uncle.color == "red":
-                    node.parent.color = "black"
-                    uncle.color = "black"
-                    node.parent.parent.color = "red"
-                    node = node.parent.parent
+        # each loop iteration binds the parent and grandparent once: the
+        # chains node.parent.parent.* otherwise re-walk two pointer hops per
+        # mention, several times per iteration
+        while node != self.root:
+            p = node.parent
+            if p.color != RED:
+                break
+            g = p.parent
+            if p == g.left:
+                uncle = g.right
+                if uncle.color == RED:
+                    p.color = BLACK
+                    uncle.color = BLACK
+                    g.color = RED
+                    node = g
                 else:
-                    if node == node.parent.right:
-                        node = node.parent
+                    if node == p.right:
+                        node = p
                         self.rotate_left(node)
-                    node.parent.color = "black"
-                    node.parent.parent.color = "red"
-                    self.rotate_right(node.parent.parent)
+                        # the rotation reparented node; re-fetch the chain
+                        p = node.parent
+                        g = p.parent
+                    p.color = BLACK
+                    g.color = RED
+                    self.rotate_right(g)
             else:
-                uncle = node.parent.parent.left
-                if uncle.color == "red":
-                    node.parent.color = "black"
-                    uncle.color = "black"
-                    node.parent.parent.color = "red"
-                    node = node.parent.parent
+                uncle = g.left
+                if uncle.color == RED:
+                    p.color = BLACK
+                    uncle.color = BLACK
+                    g.color = RED
+                    node = g
                 else:
-                    if node == node.parent.left:
-                        node = node.parent
+                    if node == p.left:
+                        node = p
                         self.rotate_right(node)
-                    node.parent.color = "black"
-                    node.parent.parent.color = "red"
-                    self.rotate_left(node.parent.parent)
-        self.root.color = "black"
+                        # the rotation reparented node; re-fetch the chain
+                        p = node.parent
+                        g = p.parent
+                    p.color = BLACK
+                    g.color = RED
+                    self.rotate_left(g)
+        self.root.color = BLACK
+
+    def bulk_load(self, keys) -> None:
+        """Build the tree from the given keys in O(n), replacing any content.
+
+        Inserting n known keys one by one costs O(n log n) with a fix-up per
+        key; when the keys are available up front it is cheaper to sort them
+        once and build a complete tree by midpoint recursion, with no
+        rotations at all. Nodes on the deepest level are colored red and all
+        others black, which satisfies the red-black invariants: every path
+        has the same number of black nodes, and the red level has only nil
+        children or none.
 
-    def shift_nodes(self, old_node: Node, new_node: Node):
+        Args:
+            keys: the keys to load (any iterable; sorted internally).
+        """
+        keys = sorted(keys)
+        n = len(keys)
+        if n == 0:
+            self.root = self.nil
+            return
+        red_depth = n.bit_length() - 1  # depth of the deepest level
+        nil = self.nil
+
+        def build(lo, hi, depth):
+            if lo >= hi:
+                return nil
+            mid = (lo + hi) // 2
+            color = RED if depth == red_depth else BLACK
+            node = Node(keys[mid], left=nil, right=nil, color=color)
+            node.left = build(lo, mid, depth + 1)
+            node.right = build(mid + 1, hi, depth + 1)
+            if node.left is not nil:
+                node.left.parent = node
+            if node.right is not nil:
+                node.right.parent = node
+            return node
+
+        self.root = build(0, n, 0)
+        self.root.parent = None
+        self.root.color = BLACK  # n == 1 would otherwise color the root red
+
+    def shift_nodes(self, old_node: Node, new_node: Node) -> None:
         """Replace the subtree rooted at old_node with the subtree rooted at new_node.
 
         Args:
             old_node: the root of the subtree to replace.
             new_node: the root of the subtree to replace with.
         """
-        if not old_node.parent:
-            self.root = new_node
-        elif old_node == old_node.parent.left:
-            old_node.parent.left = new_node
-        else:
-            old_node.parent.right = new_node
+        self._set_child(old_node.parent, old_node, new_node)
         new_node.parent = old_node.parent
 
-    def delete(self, node: Node):
+    def delete(self, node: Node) -> None:
         """Delete a node from the Red-Black Tree.
 
         Args:
             node: the node to delete.
         """
+        # the transplants below inline shift_nodes (kept above for
+        # reference) with node's parent bound once, so each delete resolves
+        # the left-or-right direction a single time
+        p = node.parent
         original_color = node.color
-        if node.left == self.nil:
+        if node.left is self.nil:
             x = node.right
-            self.shift_nodes(node, x)
-        elif node.right == self.nil:
+            self._set_child(p, node, x)
+            x.parent = p
+        elif node.right is self.nil:
             x = node.left
-            self.shift_nodes(node, x)
+            self._set_child(p, node, x)
+            x.parent = p
         else:
             v = self.minimum(node.right)
             original_color = v.color
             x = v.right
-            if v.parent == node:
+            if v.parent is node:
                 x.parent = v
             else:
-                self.shift_nodes(v, v.right)
+                # v is a subtree minimum with a nonempty path from node, so
+                # it is its parent's left child: splice x in directly rather
+                # than re-deriving the direction
+                vp = v.parent
+                vp.left = x
+                x.parent = vp
                 v.right = node.right
                 v.right.parent = v
-            self.shift_nodes(node, v)
+            self._set_child(p, node, v)
+            v.parent = p
             v.left = node.left
             v.left.parent = v
             v.color = node.color
-        if original_color == "black":
+        if original_color == BLACK:
             self.fix_delete_violations(x)
-
-    def fix_delete_violations(self, node: Node):
+        # park the unlinked node for reuse (cleared, so it pins no subtree)
+        if len(self._freelist) < self.MAX_FREELIST_SIZE:
+            node.parent = node.left = node.right = None
+            node.color = None
+            node.value = None
+            self._freelist.append(node)
+
+    def fix_delete_violations(self, node: Node) -> None:
         """Fix any Red-Black Tree delete violations.
 
         Args:
             node: the node that was deleted.
         """
-        while node != self.root and node.color == "black":
-            if node == node.parent.left:
-                s = node.parent.right
-                if s.color == "red":
-                    s.color = "black"
-                    node.parent.color = "red"
-                    self.rotate_left(node.parent)
-                    s = node.parent.right
-                if s.left.color == "black" and s.right.color == "black":
-                    s.color = "red"
-                    node = node.parent
+        # bind the parent once per iteration (node stays p's child across
+        # the sibling rotations below, so p never needs re-fetching)
+        while node != self.root and node.color == BLACK:
+            p = node.parent
+            if node == p.left:
+                s = p.right
+                if s.color == RED:
+                    s.color = BLACK
+                    p.color = RED
+                    self.rotate_left(p)
+                    s = p.right
+                if s.left.color == BLACK and s.right.color == BLACK:
+                    s.color = RED
+                    node = p
                 else:
-                    if s.right.color == "black":
-                        s.left.color = "black"
-                        s.color = "red"
+                    if s.right.color == BLACK:
+                        s.left.color = BLACK
+                        s.color = RED
                         self.rotate_right(s)
-                        s = node.parent.right
-                    s.color = node.parent.color
-                    node.parent.color = "black"
-                    s.right.color = "black"
-                    self.rotate_left(node.parent)
+                        s = p.right
+                    s.color = p.color
+                    p.color = BLACK
+                    s.right.color = BLACK
+                    self.rotate_left(p)
                     node = self.root
             else:
-                s = node.parent.left
-                if s.color == "red":
-                    s.color = "black"
-                    node.parent.color = "red"
-                    self.rotate_right(node.parent)
-                    s = node.parent.left
-                if s.right.color == "black" and s.left.color == "black":
-                    s.color = "red"
-                    node = node.parent
+                s = p.left
+                if s.color == RED:
+                    s.color = BLACK
+                    p.color = RED
+                    self.rotate_right(p)
+                    s = p.left
+                if s.right.color == BLACK and s.left.color == BLACK:
+                    s.color = RED
+                    node = p
                 else:
-                    if s.left.color == "black":
-                        s.right.color = "black"
-                        s.color = "red"
+                    if s.left.color == BLACK:
+                        s.right.color = BLACK
+                        s.color = RED
                         self.rotate_left(s)
-                        s = node.parent.left
-                    s.color = node.parent.color
-                    node.parent.color = "black"
-                    s.left.color = "black"
-                    self.rotate_right(node.parent)
+                        s = p.left
+                    s.color = p.color
+                    p.color = BLACK
+                    s.left.color = BLACK
+                    self.rotate_right(p)
                     node = self.root
-        node.color = "black"
+        node.color = BLACK
+
+    def freeze(self):
+        """Snapshot the tree into arrays in the van Emde Boas layout.
+
+        The vEB (cache-oblivious) layout recursively splits the tree's h
+        levels into a top half and its bottom subtrees and stores each
+        half contiguously, so any root-to-leaf walk touches O(log_B n)
+        blocks for every block size B at once - unlike the pointer tree,
+        where each level can land on a different cache line. The snapshot
+        is read-only; inserts and deletes continue on the mutable tree
+        (see search_frozen for the lookup loop).
+
+        Returns:
+            A tuple (keys, left, right) of parallel arrays, with the root
+            at index 0 and -1 marking an absent child.
+        """
+        nil = self.nil
+
+        def height(node):
+            h = 0
+            stack = [(node, 1)]
+            while stack:
+                u, d = stack.pop()
+                if u is nil:
+                    continue
+                h = max(h, d)
+                stack.append((u.left, d + 1))
+                stack.append((u.right, d + 1))
+            return h
+
+        out = []
+
+        def emit(node, h):
+            """Append the top h levels under node in vEB order.
+
+            Returns:
+                The frontier of nodes immediately below the emitted region.
+            """
+            if node is nil:
+                return []
+            if h == 1:
+                out.append(node)
+                return [c for c in (node.left, node.right) if c is not nil]
+            top_h = h // 2
+            frontier = emit(node, top_h)
+            below = []
+            for f in frontier:
+                below.extend(emit(f, h - top_h))
+            return below
+
+        emit(self.root, max(height(self.root), 1))
+        index = {id(node): i for i, node in enumerate(out)}
+        keys = array("q", [0]) * len(out)
+        left = array("l", [0]) * len(out)
+        right = array("l", [0]) * len(out)
+        for i, node in enumerate(out):
+            keys[i] = node.key
+            left[i] = index[id(node.left)] if node.left is not nil else -1
+            right[i] = index[id(node.right)] if node.right is not nil else -1
+        return keys, left, right
 
     def __contains__(self, key) -> bool:
         """Check if the tree contains a node with the given key.
@@ -330,7 +641,7 @@ class RedBlackTree:
         """
         return self.search(key) is not self.nil
 
-    def __delitem__(self, key):
+    def __delitem__(self, key) -> None:
         """Delete the node with the given key from the tree.
 
         Args:
@@ -341,7 +652,7 @@ class RedBlackTree:
             raise KeyError(str(key))
         self.delete(node)
 
-    def __setitem__(self, key, value):
+    def __setitem__(self, key, value) -> None:
         """Insert or update node value, providing a dictionary-like interface.
 
         Args:
@@ -370,32 +681,48 @@ class RedBlackTree:
 
 
 
+def search_frozen(keys, left, right, key) -> int:
+    """Search a frozen tree (as produced by RedBlackTree.freeze) for a key.
+
+    Args:
+        keys: the key array of the frozen tree.
+        left: the left-child index array (-1 for absent).
+        right: the right-child index array (-1 for absent).
+        key: the key to search for.
+
+    Returns:
+        The index of the key in the frozen arrays, or -1 if absent.
+    """
+    if not keys:
+        return -1
+    i = 0
+    while i >= 0 and keys[i] != key:
+        i = left[i] if key < keys[i] else right[i]
+    return i
+
+
 def main():
     rbt = RedBlackTree()
     insert_keys = [5, 3, 2, 7, 1, 8, 9, 12]
-    node_list = [Node(key) for key in insert_keys]
-    for node in node_list:
-        rbt.insert(node)
+    for key in insert_keys:
+        rbt.insert_key(key)
 
-    # print out traversals
+    # print out traversals (each traversal returns its keys, which are
+    # emitted in a single print call rather than one write per key)
     print(f"Inorder traversal")
-    rbt.inorder(rbt.root)
-    print("")
+    print(*rbt.inorder(rbt.root))
     print(f"Preorder traversal")
-    rbt.preorder(rbt.root)
-    print("")
+    print(*rbt.preorder(rbt.root))
     print(f"Postorder traversal")
-    rbt.preorder(rbt.root)
-    print("")
+    print(*rbt.postorder(rbt.root))
 
-    node_to_delete = node_list[3]
+    node_to_delete = rbt.search(7)
     print(f"Deleting node {node_to_delete}")
     rbt.delete(node_to_delete)
 
     # print out traversal
     print(f"Inorder traversal after deletion")
-    rbt.inorder(rbt.root)
-    print("")
+    print(*rbt.inorder(rbt.root))
 
     # print out minimum and maximum
     print(f"Minimum key: {rbt.minimum(rbt.root).key}")
@@ -409,7 +736,7 @@ def main():
     Preorder traversal
     3 2 1 7 5 9 8 12
     Postorder traversal
-    3 2 1 7 5 9 8 12
+    1 2 5 8 12 9 7 3
     Deleting node Node(7, color=red) parent=3 left=5 right=9
     Inorder traversal after deletion
     1 2 3 5 8 9 12